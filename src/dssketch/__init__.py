@@ -7,21 +7,64 @@ and verbose .designspace XML files for variable font design.
 
 __version__ = "1.1.17"
 
-# Import all components from modular structure
-# Import high-level API functions
-from .api import (
-    convert_designspace_to_dss_string,
-    convert_dss_string_to_designspace,
-    convert_to_designspace,
-    convert_to_dss,
-)
-from .converters.designspace_to_dss import DesignSpaceToDSS
-from .converters.dss_to_designspace import DSSToDesignSpace
-from .core.mappings import Standards, UnifiedMappings
-from .core.models import DSSAxis, DSSDocument, DSSInstance, DSSSource, DSSRule
-from .core.validation import UFOValidator, ValidationReport
-from .parsers.dss_parser import DSSParser
-from .writers.dss_writer import DSSWriter
+from typing import TYPE_CHECKING
+
+# Lightweight models are imported eagerly; everything that pulls in fontTools,
+# defcon or PyYAML is imported on first attribute access (PEP 562), so that
+# `import dssketch` and `dssketch --help` stay fast.
+from .core.models import DSSAxis, DSSDocument, DSSInstance, DSSRule, DSSSource
+
+_LAZY_IMPORTS = {
+    # High-level API functions
+    "convert_designspace_to_dss_string": ".api",
+    "convert_dss_string_to_designspace": ".api",
+    "convert_to_designspace": ".api",
+    "convert_to_dss": ".api",
+    # Converters
+    "DesignSpaceToDSS": ".converters.designspace_to_dss",
+    "DSSToDesignSpace": ".converters.dss_to_designspace",
+    # Mappings
+    "Standards": ".core.mappings",
+    "UnifiedMappings": ".core.mappings",
+    # Validation
+    "UFOValidator": ".core.validation",
+    "ValidationReport": ".core.validation",
+    # Parser and Writer
+    "DSSParser": ".parsers.dss_parser",
+    "DSSWriter": ".writers.dss_writer",
+}
+
+if TYPE_CHECKING:
+    from .api import (
+        convert_designspace_to_dss_string,
+        convert_dss_string_to_designspace,
+        convert_to_designspace,
+        convert_to_dss,
+    )
+    from .converters.designspace_to_dss import DesignSpaceToDSS
+    from .converters.dss_to_designspace import DSSToDesignSpace
+    from .core.mappings import Standards, UnifiedMappings
+    from .core.validation import UFOValidator, ValidationReport
+    from .parsers.dss_parser import DSSParser
+    from .writers.dss_writer import DSSWriter
+
+
+def __getattr__(name: str):
+    """Import heavy public components on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 # Public API
 __all__ = [
@@ -57,43 +100,49 @@ __all__ = [
 ]
 
 
-def convert_file(input_path: str, output_path: str = None, optimize: bool = True):
+def convert_file(
+    input_path: str, output_path: str = None, optimize: bool = True, use_cache: bool = False
+):
     """High-level conversion function between .designspace and .dssketch formats
 
     Args:
         input_path: Path to input file (.designspace or .dssketch)
         output_path: Path to output file (auto-detected if None)
         optimize: Whether to optimize output (default True)
+        use_cache: Reuse the converted document from a previous run if a
+                   .designspace input is unchanged (default False). Cached
+                   documents are pickled to the user data directory
 
     Returns:
         Path to output file
     """
     from pathlib import Path
 
-    input_file = Path(input_path)
-
-    if not output_path:
-        if input_file.suffix.lower() == ".designspace":
-            output_path = input_file.with_suffix(".dssketch")
-        elif input_file.suffix.lower() in [".dssketch", ".dss"]:
-            output_path = input_file.with_suffix(".designspace")
-        else:
-            raise ValueError(f"Unknown input file format: {input_file.suffix}")
+    from .api import _convert_designspace_file
+    from .converters.dss_to_designspace import DSSToDesignSpace
+    from .parsers.dss_parser import DSSParser
+    from .writers.dss_writer import DSSWriter
 
-    output_file = Path(output_path)
+    input_file = Path(input_path)
+    suffix = input_file.suffix.lower()
+
+    if output_path:
+        output_file = Path(output_path)
+    elif suffix == ".designspace":
+        output_file = input_file.with_suffix(".dssketch")
+    elif suffix in (".dssketch", ".dss"):
+        output_file = input_file.with_suffix(".designspace")
+    else:
+        raise ValueError(f"Unknown input file format: {input_file.suffix}")
 
-    if input_file.suffix.lower() == ".designspace":
+    if suffix == ".designspace":
         # Convert DesignSpace to DSS
-        converter = DesignSpaceToDSS()
-        dss_doc = converter.convert_file(str(input_file))
+        dss_doc, _ = _convert_designspace_file(input_file, use_cache=use_cache)
 
         writer = DSSWriter(optimize=optimize)
-        dss_content = writer.write(dss_doc)
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(dss_content)
+        writer.write_file(dss_doc, output_file)
 
-    elif input_file.suffix.lower() in [".dssketch", ".dss"]:
+    elif suffix in (".dssketch", ".dss"):
         # Convert DSS to DesignSpace
         parser = DSSParser()
         dss_doc = parser.parse_file(str(input_file))
@@ -118,6 +167,8 @@ def parse_dss(content: str) -> DSSDocument:
     Returns:
         Parsed DSSDocument
     """
+    from .parsers.dss_parser import DSSParser
+
     parser = DSSParser()
     return parser.parse(content)
 
@@ -132,5 +183,7 @@ def write_dss(dss_doc: DSSDocument, optimize: bool = True) -> str:
     Returns:
         DSS format string
     """
+    from .writers.dss_writer import DSSWriter
+
     writer = DSSWriter(optimize=optimize)
     return writer.write(dss_doc)
@@ -5,17 +5,154 @@ High-level API functions for integrating DSSketch into other projects.
 Provides simple conversion functions that accept DesignSpace objects and DSS file paths.
 """
 
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union
+from typing import Callable, Optional, Tuple, Union
 
 from fontTools.designspaceLib import DesignSpaceDocument
 
 from .converters.designspace_to_dss import DesignSpaceToDSS
 from .converters.dss_to_designspace import DSSToDesignSpace
+from .core.models import DSSDocument
 from .parsers.dss_parser import DSSParser
 from .utils.logging import DSSketchLogger
 from .writers.dss_writer import DSSWriter
 
+# In-process conversion cache: key -> pickled DSSDocument, least recently used first
+# (stored pickled so every hit returns a fresh document the caller may modify)
+_memory_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_MEMORY_CACHE_SIZE = 16
+
+# Entries kept in <user data dir>/cache/ for the current version; the least
+# recently used ones beyond this are deleted, as are entries of other versions
+_DISK_CACHE_SIZE = 64
+
+
+def _remember(key: str, data: bytes) -> None:
+    """Store an entry in the in-process cache, evicting the least recently used"""
+    _memory_cache[key] = data
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _prune_disk_cache(cache_dir: Path, version: str) -> None:
+    """Delete cache files of other package versions and all but the newest entries"""
+    current = []
+    stale = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(f"-{version}.pkl"):
+            current.append((entry.stat().st_mtime_ns, entry.path))
+        elif entry.name.endswith((".pkl", ".tmp")) and not entry.name.endswith(
+            f"-{version}.tmp"
+        ):
+            stale.append(entry.path)
+
+    current.sort(reverse=True)
+    stale.extend(path for _, path in current[_DISK_CACHE_SIZE:])
+    for stale_path in stale:
+        try:
+            os.remove(stale_path)
+        except FileNotFoundError:
+            # Already removed by another process pruning the same directory
+            pass
+
+
+def _cache_key(path: Path, *params) -> str:
+    """Content hash of an input file plus everything else the parse result depends on
+
+    Covers the input bytes, conversion parameters and user data overrides
+    (e.g. discrete-axis-labels.yaml) - changing any of them invalidates the entry.
+    """
+    from .config import get_data_manager
+
+    digest = hashlib.blake2b(path.read_bytes(), digest_size=16)
+    digest.update(repr((path.suffix.lower(), params)).encode("utf-8"))
+    for data_file in sorted(get_data_manager().user_data_dir.glob("*")):
+        if data_file.is_file():
+            stat = data_file.stat()
+            digest.update(f"{data_file.name}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _cached_document(
+    path: Path, build: Callable[[], DSSDocument], *params, use_cache: bool = False
+) -> DSSDocument:
+    """Return DSSDocument for an input file, reusing a previous result if unchanged
+
+    Results are kept in memory and pickled to <user data dir>/cache/, keyed by
+    _cache_key() and the package version; both caches are bounded and evict the
+    least recently used entries. Cache failures never fail a conversion.
+    """
+    if not use_cache:
+        return build()
+
+    from . import __version__
+    from .config import get_data_manager
+
+    try:
+        key = _cache_key(path, *params)
+        cache_file = get_data_manager().user_data_dir / "cache" / f"{key}-{__version__}.pkl"
+    except OSError as e:
+        DSSketchLogger.debug(f"Conversion cache unavailable: {e}")
+        return build()
+
+    data = _memory_cache.get(key)
+    if data is None and cache_file.exists():
+        try:
+            data = cache_file.read_bytes()
+            # Mark the entry as recently used for _prune_disk_cache()
+            os.utime(cache_file)
+        except OSError:
+            data = None
+
+    if data is not None:
+        try:
+            dss_doc = pickle.loads(data)
+            _remember(key, data)
+            DSSketchLogger.debug(f"Using cached conversion for {path.name}")
+            return dss_doc
+        except Exception as e:
+            DSSketchLogger.debug(f"Ignoring unreadable cache entry {cache_file.name}: {e}")
+
+    dss_doc = build()
+
+    try:
+        data = pickle.dumps(dss_doc, protocol=pickle.HIGHEST_PROTOCOL)
+        _remember(key, data)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, cache_file)
+        _prune_disk_cache(cache_file.parent, __version__)
+    except Exception as e:
+        DSSketchLogger.debug(f"Could not write conversion cache: {e}")
+
+    return dss_doc
+
+
+def _convert_designspace_file(
+    ds_path: Path, vars_threshold: int = 3, use_cache: bool = False
+) -> Tuple[DSSDocument, Optional[DesignSpaceDocument]]:
+    """Convert a .designspace file to DSSDocument, reusing the cached result for unchanged input
+
+    The XML is only read on a cache miss. Returns (dss_doc, ds_doc) where ds_doc is the
+    DesignSpaceDocument read for the conversion, or None if the cached result was used.
+    """
+    parsed = []
+
+    def build() -> DSSDocument:
+        converter = DesignSpaceToDSS(vars_threshold=vars_threshold)
+        dss_doc, ds_doc = converter.convert_file_with_doc(str(ds_path))
+        parsed.append(ds_doc)
+        return dss_doc
+
+    dss_doc = _cached_document(ds_path, build, vars_threshold, use_cache=use_cache)
+    return dss_doc, (parsed[0] if parsed else None)
+
 
 def convert_to_dss(
     designspace: DesignSpaceDocument,
@@ -61,11 +198,8 @@ def convert_to_dss(
 
     # Write DSS document to file
     writer = DSSWriter(optimize=optimize, avar2_format=avar2_format)
-    dss_content = writer.write(dss_doc)
-
     dss_file = Path(dss_path)
-    with open(dss_file, "w", encoding="utf-8") as f:
-        f.write(dss_content)
+    writer.write_file(dss_doc, dss_file)
 
     return str(dss_file)
 
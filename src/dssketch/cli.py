@@ -5,30 +5,31 @@ Command-line interface for converting between .dssketch and .designspace formats
 """
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
-from . import (
-    DesignSpaceToDSS,
-    DSSParser,
-    DSSToDesignSpace,
-    DSSWriter,
-    UFOValidator,
-)
 from .utils.logging import DSSketchLogger
 
 
-def main():
-    """Simplified CLI for DesignSpace Sketch conversion"""
-    parser = argparse.ArgumentParser(
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once per process"""
+    arg_parser = argparse.ArgumentParser(
         prog="dssketch",
         description="Simple converter between .dssketch and .designspace formats\n"
         "Automatically detects input format and converts to the other format.",
     )
-    parser.add_argument("input", help="Input file (.dssketch or .designspace)")
-    parser.add_argument("-o", "--output", help="Output file (optional, defaults to same directory)")
+    arg_parser.add_argument(
+        "input", nargs="+", help="Input file(s) (.dssketch or .designspace)"
+    )
+    arg_parser.add_argument(
+        "-o",
+        "--output",
+        help="Output file (optional, defaults to same directory; single input only)",
+    )
 
     # avar2 format options (mutually exclusive)
-    avar2_group = parser.add_mutually_exclusive_group()
+    avar2_group = arg_parser.add_mutually_exclusive_group()
     avar2_group.add_argument(
         "--matrix",
         action="store_true",
@@ -42,7 +43,7 @@ def main():
     )
 
     # avar2 variable generation options (mutually exclusive)
-    vars_group = parser.add_mutually_exclusive_group()
+    vars_group = arg_parser.add_mutually_exclusive_group()
     vars_group.add_argument(
         "--novars",
         action="store_true",
@@ -58,22 +59,49 @@ def main():
         help="Generate variables for values appearing N+ times (default: 3)",
     )
 
-    args = parser.parse_args()
+    arg_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-convert .designspace input instead of reusing the result of a previous run",
+    )
+
+    return arg_parser
 
-    input_path = Path(args.input)
+
+def main():
+    """Simplified CLI for DesignSpace Sketch conversion"""
+    arg_parser = _build_parser()
+    args = arg_parser.parse_args()
+
+    if args.output and len(args.input) > 1:
+        arg_parser.error("--output can only be used with a single input file")
+
+    # Several inputs are converted in one process, sharing the loaded
+    # modules, mapping data and conversion caches
+    exit_code = 0
+    for input_name in args.input:
+        if _convert_one(Path(input_name), args) != 0:
+            exit_code = 1
+    return exit_code
+
+
+def _convert_one(input_path: Path, args: argparse.Namespace) -> int:
+    """Convert a single input file, returning the exit code for it"""
+    input_str = str(input_path)
 
     if not input_path.exists():
         DSSketchLogger.error(f"Input file {input_path} does not exist")
         return 1
 
     # Setup logging for this conversion
-    DSSketchLogger.setup_logger(str(input_path))
+    DSSketchLogger.setup_logger(input_str)
 
     try:
         # Auto-detect output format based on input extension
-        if input_path.suffix.lower() in [".dssketch", ".dss"]:
+        suffix = input_path.suffix.lower()
+        if suffix in (".dssketch", ".dss"):
             output_format = "designspace"
-        elif input_path.suffix.lower() == ".designspace":
+        elif suffix == ".designspace":
             output_format = "dssketch"
         else:
             DSSketchLogger.error(f"Unsupported input format {input_path.suffix}")
@@ -84,11 +112,16 @@ def main():
         if output_format == "designspace":
             # Convert .dssketch/.dss to .designspace
             DSSketchLogger.info("Starting DSSketch to DesignSpace conversion")
-            parser = DSSParser()
-            dss_doc = parser.parse_file(str(input_path))
+            from .converters.dss_to_designspace import DSSToDesignSpace
+            from .core.validation import UFOValidator
+            from .parsers.dss_parser import DSSParser
+
+            # Always parsed: the parser reports validation issues to the log as it goes
+            dss_parser = DSSParser()
+            dss_doc = dss_parser.parse_file(input_str)
 
             # Simple UFO validation with basic error handling
-            validation_report = UFOValidator.validate_ufo_files(dss_doc, str(input_path))
+            validation_report = UFOValidator.validate_ufo_files(dss_doc, input_str)
             if validation_report.has_errors:
                 if validation_report.path_errors:
                     for error in validation_report.path_errors:
@@ -124,13 +157,22 @@ def main():
             # Determine variable threshold (0 = disabled)
             vars_threshold = 0 if args.novars else args.vars
 
-            converter = DesignSpaceToDSS(vars_threshold=vars_threshold)
-            dss_doc = converter.convert_file(str(input_path))
+            from .api import _convert_designspace_file
+            from .writers.dss_writer import DSSWriter
 
-            # Load DesignSpace document for glyph validation
-            from fontTools.designspaceLib import DesignSpaceDocument
+            # DesignSpace XML is read at most once: for the conversion on a cache miss,
+            # or afterwards only if rules need it for glyph validation in the writer
+            dss_doc, ds_doc = _convert_designspace_file(
+                input_path, vars_threshold=vars_threshold, use_cache=not args.no_cache
+            )
+            needs_ds_doc = any(len(rule.substitutions) > 1 for rule in dss_doc.rules)
+            if not needs_ds_doc:
+                # Release the parsed DesignSpace document before writing
+                ds_doc = None
+            elif ds_doc is None:
+                from fontTools.designspaceLib import DesignSpaceDocument
 
-            ds_doc = DesignSpaceDocument.fromfile(str(input_path))
+                ds_doc = DesignSpaceDocument.fromfile(input_str)
 
             # Determine avar2 format
             avar2_format = "linear" if args.linear else "matrix"
@@ -141,11 +183,8 @@ def main():
                 base_path=str(input_path.parent),
                 avar2_format=avar2_format,
             )
-            dss_content = writer.write(dss_doc)
-
             output_path = Path(args.output) if args.output else input_path.with_suffix(".dssketch")
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(dss_content)
+            writer.write_file(dss_doc, output_path)
             DSSketchLogger.success(f"Converted {input_path.name} -> {output_path.name}")
             print(f"✓ Conversion completed successfully: {output_path}")
 
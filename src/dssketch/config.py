@@ -2,46 +2,84 @@
 
 import json
 import os
-import platform
 import shutil
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import Any, Dict, Optional, Union
 
 from .utils.logging import DSSketchLogger
 
+try:
+    import orjson  # Optional speedup: pip install "dssketch[speed]"
+except ImportError:
+    orjson = None
+
+
+def parse_json(content: Union[str, bytes]) -> Any:
+    """Parse JSON content, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN literals) - let json decide
+            pass
+    return json.loads(content)
+
+
+def parse_yaml(content: Union[str, bytes]) -> Any:
+    """Parse YAML content safely, using the libyaml loader when available
+
+    PyYAML is imported on first use to keep it out of CLI startup.
+    """
+    import yaml
+
+    return yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+# Package data directory (built-in defaults)
+_PACKAGE_DATA_DIR = Path(__file__).parent / "data"
+
+# User data directories already created in this process
+_created_dirs = set()
+
+
+@lru_cache(maxsize=1)
+def _default_user_data_dir() -> Path:
+    """Get user data directory based on OS or environment variable (resolved once)"""
+    # Check for custom path in environment
+    if custom_dir := os.environ.get("DSSKETCH_DATA_DIR"):
+        return Path(custom_dir).expanduser()
+
+    # OS-specific default paths
+    if sys.platform == "darwin":  # macOS
+        return Path.home() / "Library" / "Application Support" / "dssketch"
+    elif sys.platform == "win32":
+        app_data = os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming")
+        return Path(app_data) / "dssketch"
+    else:  # Linux and others
+        xdg_config = os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")
+        return Path(xdg_config) / "dssketch"
+
 
 class DataManager:
     """Manages DSSketch data files with user override support"""
 
     def __init__(self):
         # Package data directory (built-in defaults)
-        self.package_data_dir = Path(__file__).parent / "data"
+        self.package_data_dir = _PACKAGE_DATA_DIR
 
         # User data directory (overrides)
         self.user_data_dir = self._get_user_data_dir()
 
-        # Create user directory if it doesn't exist
-        self.user_data_dir.mkdir(parents=True, exist_ok=True)
+        # Create user directory if it doesn't exist (once per process)
+        if self.user_data_dir not in _created_dirs:
+            self.user_data_dir.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(self.user_data_dir)
 
     def _get_user_data_dir(self) -> Path:
         """Get user data directory based on OS or environment variable"""
-        # Check for custom path in environment
-        if custom_dir := os.environ.get("DSSKETCH_DATA_DIR"):
-            return Path(custom_dir).expanduser()
-
-        # OS-specific default paths
-        system = platform.system()
-
-        if system == "Darwin":  # macOS
-            return Path.home() / "Library" / "Application Support" / "dssketch"
-        elif system == "Windows":
-            app_data = os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming")
-            return Path(app_data) / "dssketch"
-        else:  # Linux and others
-            xdg_config = os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")
-            return Path(xdg_config) / "dssketch"
+        return _default_user_data_dir()
 
     def load_data_file(self, filename: str) -> Dict[str, Any]:
         """Load data file with user override priority"""
@@ -62,17 +100,19 @@ class DataManager:
         """Load JSON or YAML file based on extension"""
         try:
             with open(filepath, encoding="utf-8") as f:
-                if filepath.suffix in [".yaml", ".yml"]:
-                    return yaml.safe_load(f) or {}
-                elif filepath.suffix == ".json":
-                    return json.load(f)
-                else:
-                    # Try YAML first, then JSON
-                    content = f.read()
+                content = f.read()
+            if filepath.suffix in [".yaml", ".yml"]:
+                return parse_yaml(content) or {}
+            elif filepath.suffix == ".json":
+                return parse_json(content)
+            else:
+                # Unknown suffix: JSON documents start with { or [, anything else is YAML
+                if content.lstrip()[:1] in ("{", "["):
                     try:
-                        return yaml.safe_load(content) or {}
-                    except yaml.YAMLError:
-                        return json.loads(content)
+                        return parse_json(content) or {}
+                    except ValueError:
+                        pass  # YAML flow collection, e.g. "{a: 1}"
+                return parse_yaml(content) or {}
         except Exception as e:
             DSSketchLogger.warning(f"Error loading {filepath}: {e}")
             return {}
@@ -84,15 +124,19 @@ class DataManager:
         try:
             with open(filepath, "w", encoding="utf-8") as f:
                 if filepath.suffix in [".yaml", ".yml"]:
+                    import yaml
+
                     yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
                 else:
                     json.dump(data, f, indent=2, ensure_ascii=False)
+            _invalidate()
             DSSketchLogger.info(f"Saved to {filepath}")
         except Exception as e:
             DSSketchLogger.error(f"Error saving {filepath}: {e}")
 
     def reset_to_defaults(self, filename: Optional[str] = None) -> None:
         """Reset user files to package defaults"""
+        _invalidate()
         if filename:
             # Reset specific file
             user_file = self.user_data_dir / filename
@@ -147,6 +191,7 @@ class DataManager:
 
         try:
             shutil.copy2(package_file, user_file)
+            _invalidate()
             DSSketchLogger.info(f"Copied {filename} to user directory")
             return True
         except Exception as e:
@@ -166,16 +211,30 @@ def get_data_manager() -> DataManager:
     return _data_manager
 
 
+# Data files are loaded once per process; treat the returned dicts as read-only.
+# DataManager methods that modify user files call _invalidate().
+
+
+@lru_cache(maxsize=None)
 def load_unified_mappings() -> Dict[str, Any]:
     """Load unified-mappings.yaml with user overrides"""
     return get_data_manager().load_data_file("unified-mappings.yaml")
 
 
+@lru_cache(maxsize=None)
 def load_discrete_labels() -> Dict[str, Any]:
     """Load discrete-axis-labels.yaml with user overrides"""
     return get_data_manager().load_data_file("discrete-axis-labels.yaml")
 
 
+@lru_cache(maxsize=None)
 def load_translations() -> Dict[str, Any]:
     """Load font-resources-translations.json with user overrides"""
     return get_data_manager().load_data_file("font-resources-translations.json")
+
+
+def _invalidate() -> None:
+    """Forget cached data files after user overrides change"""
+    load_unified_mappings.cache_clear()
+    load_discrete_labels.cache_clear()
+    load_translations.cache_clear()
@@ -4,9 +4,14 @@ DesignSpace to DSS converter
 This module converts DesignSpace documents to DSS format.
 """
 
-import json
+import os
+import posixpath
+import sys
+from collections import Counter, defaultdict
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 from fontTools.designspaceLib import (
     AxisDescriptor,
@@ -16,11 +21,28 @@ from fontTools.designspaceLib import (
     SourceDescriptor,
 )
 
+from ..config import parse_json
 from ..core.models import DSSAxis, DSSAxisMapping, DSSDocument, DSSInstance, DSSSource, DSSRule, DSSAvar2Mapping
+from ..utils.paths import to_posix_path
+
+# (axis name, user default, discrete values or None, default in design space)
+_AxisDefault = Tuple[str, float, Optional[FrozenSet[float]], float]
+
+# Descriptor features that depend on the installed fontTools version, probed once
+_HAS_AXIS_MAPPINGS = hasattr(DesignSpaceDocument(), "axisMappings")  # avar2 mappings
+_HAS_CONDITION_SETS = hasattr(RuleDescriptor(), "conditionSets")
 
 
 class DesignSpaceToDSS:
-    """Convert DesignSpace to DSS format"""
+    """Convert DesignSpace to DSS format
+
+    Per-document lookups (axis defaults, axis maps, tags) are built inside convert()
+    and passed down explicitly, so a converter holds no per-conversion state and one
+    instance can convert several documents, also from different threads.
+    """
+
+    # Parsed font-resources-translations.json, shared by all converter instances
+    _font_resources: Optional[Mapping[str, Any]] = None
 
     def __init__(self, vars_threshold: int = 3):
         """Initialize converter.
@@ -30,28 +52,58 @@ class DesignSpaceToDSS:
                            0 = disabled, 3 = default (values appearing 3+ times)
         """
         self.vars_threshold = vars_threshold
-        self.font_resources = {}
-        self.load_external_data()
 
-    def load_external_data(self):
-        """Load external font resource translations"""
-        data_dir = Path(__file__).parent.parent / "data"
+    @property
+    def font_resources(self) -> Mapping[str, Any]:
+        """Font resource translations, read on first access"""
+        return self._get_font_resources()
+
+    def load_external_data(self) -> None:
+        """Load external font resource translations (read once per process)"""
+        self._get_font_resources()
 
-        try:
-            with open(data_dir / "font-resources-translations.json", encoding="utf-8") as f:
-                self.font_resources = json.load(f)
-        except FileNotFoundError:
-            pass
+    @classmethod
+    def _get_font_resources(cls) -> Mapping[str, Any]:
+        """Read bundled font resource translations on first use
+
+        Returned read-only, since the same mapping is shared by all instances.
+        """
+        if cls._font_resources is None:
+            data_dir = Path(__file__).parent.parent / "data"
+
+            try:
+                # Raw bytes go straight to the JSON parser (orjson parses UTF-8 natively)
+                resources_file = data_dir / "font-resources-translations.json"
+                resources = parse_json(resources_file.read_bytes())
+            except FileNotFoundError:
+                resources = {}
+            cls._font_resources = MappingProxyType(resources)
+        return cls._font_resources
 
     def convert_file(self, ds_path: str) -> DSSDocument:
         """Convert DesignSpace file to DSS document"""
+        dss_doc, _ = self.convert_file_with_doc(ds_path)
+        return dss_doc
+
+    def convert_file_with_doc(self, ds_path: str) -> Tuple[DSSDocument, DesignSpaceDocument]:
+        """Convert DesignSpace file, also returning the parsed DesignSpace document
+
+        Lets callers that need the DesignSpace document too (e.g. DSSWriter glyph
+        validation) reuse it instead of reading the file a second time.
+        """
         doc = DesignSpaceDocument()
         doc.read(ds_path)
-        return self.convert(doc)
+        return self.convert(doc), doc
 
     def convert(self, ds_doc: DesignSpaceDocument) -> DSSDocument:
         """Convert DesignSpace document to DSS document"""
-        dss_doc = DSSDocument(family=self._extract_family_name(ds_doc))
+        # Axis data shared by the family name lookup and all sources, resolved once
+        # (names are interned so location dicts share one key object per axis)
+        axis_defaults = {sys.intern(axis.name): axis.default for axis in ds_doc.axes}
+        axis_map_pairs = [self._axis_map_pairs(axis) for axis in ds_doc.axes]
+        axes_meta = self._default_source_axes(ds_doc, axis_map_pairs)
+
+        dss_doc = DSSDocument(family=self._extract_family_name(ds_doc, axis_defaults))
 
         # Determine common path for sources
         sources_path = self._determine_sources_path(ds_doc)
@@ -63,8 +115,8 @@ class DesignSpaceToDSS:
         hidden_axis_names = self._determine_hidden_axes(ds_doc)
 
         # Convert axes - separate regular and hidden axes
-        for axis in ds_doc.axes:
-            dss_axis = self._convert_axis(axis)
+        for axis, map_pairs in zip(ds_doc.axes, axis_map_pairs):
+            dss_axis = self._convert_axis(axis, map_pairs)
             # Check if this axis should be hidden
             if axis.name in hidden_axis_names:
                 dss_doc.hidden_axes.append(dss_axis)
@@ -72,11 +124,13 @@ class DesignSpaceToDSS:
                 dss_doc.axes.append(dss_axis)
 
         # Convert avar2 mappings
-        if hasattr(ds_doc, 'axisMappings') and ds_doc.axisMappings:
-            # First, convert all mappings
-            for mapping in ds_doc.axisMappings:
-                dss_mapping = self._convert_avar2_mapping(mapping, ds_doc)
-                dss_doc.avar2_mappings.append(dss_mapping)
+        if _HAS_AXIS_MAPPINGS and ds_doc.axisMappings:
+            # First, convert all mappings (axis name -> tag lookup is shared by all of them)
+            tags_by_name = self._axis_tags_by_name(ds_doc)
+            dss_doc.avar2_mappings.extend(
+                self._convert_avar2_mapping(mapping, ds_doc, tags_by_name)
+                for mapping in ds_doc.axisMappings
+            )
 
             # Generate variables for repeated values (named $axis1 to avoid confusion with axis.default)
             if self.vars_threshold > 0:
@@ -85,41 +139,39 @@ class DesignSpaceToDSS:
                 )
 
         # Convert sources
-        for source in ds_doc.sources:
-            dss_source = self._convert_source(source, ds_doc, sources_path)
-            dss_doc.sources.append(dss_source)
+        dss_doc.sources.extend(
+            self._convert_source(source, ds_doc, sources_path, axes_meta, axis_defaults)
+            for source in ds_doc.sources
+        )
 
         # Convert instances (optional - can be auto-generated)
         if ds_doc.instances:
-            for instance in ds_doc.instances:
-                dss_instance = self._convert_instance(instance, ds_doc)
-                dss_doc.instances.append(dss_instance)
+            dss_doc.instances.extend(
+                self._convert_instance(instance, ds_doc) for instance in ds_doc.instances
+            )
         else:
             # No instances in original - set instances_off to preserve this
             dss_doc.instances_off = True
 
         # Convert rules
-        for rule in ds_doc.rules:
-            dss_rule = self._convert_rule(rule, ds_doc)
-            if dss_rule:
-                dss_doc.rules.append(dss_rule)
+        dss_rules = (self._convert_rule(rule, ds_doc) for rule in ds_doc.rules)
+        dss_doc.rules.extend(dss_rule for dss_rule in dss_rules if dss_rule)
 
         return dss_doc
 
-    def _extract_family_name(self, ds_doc: DesignSpaceDocument) -> str:
+    def _extract_family_name(
+        self, ds_doc: DesignSpaceDocument, axis_defaults: Optional[Dict[str, float]] = None
+    ) -> str:
         """Extract family name from default source in DesignSpace document"""
         # First try to find default source (copyLib=True or matching default coordinates)
-        default_source = None
-        for source in ds_doc.sources:
-            if source.copyLib:
-                default_source = source
-                break
+        default_source = next((source for source in ds_doc.sources if source.copyLib), None)
 
         # If no copyLib, find source at default coordinates
         if not default_source and ds_doc.sources:
-            default_location = {axis.name: axis.default for axis in ds_doc.axes}
+            if axis_defaults is None:
+                axis_defaults = {axis.name: axis.default for axis in ds_doc.axes}
             for source in ds_doc.sources:
-                if source.location == default_location:
+                if source.location == axis_defaults:
                     default_source = source
                     break
 
@@ -134,38 +186,35 @@ class DesignSpaceToDSS:
         if not ds_doc.sources:
             return None
 
-        # Collect all source paths
-        source_paths = []
+        # Find the one directory shared by sources (root-level sources don't count),
+        # working on the filename strings and stopping at the first different directory
+        common_dir = None
         for source in ds_doc.sources:
-            if source.filename:
-                source_paths.append(Path(source.filename))
-
-        if not source_paths:
-            return None
-
-        # Find common directory
-        directories = set()
-        for path in source_paths:
-            if path.parent != Path("."):
-                directories.add(path.parent)
+            filename = source.filename
+            if not filename:
+                continue
+            directory = os.path.dirname(filename)
+            if not directory or directory == ".":
+                continue
+            if common_dir is None:
+                common_dir = directory
+            elif directory != common_dir:
+                # Sources are in different directories
+                return None
 
         # If all sources are in root directory (no parent path)
-        if not directories:
+        if common_dir is None:
             return None
 
-        # If all sources are in the same directory
-        if len(directories) == 1:
-            common_dir = directories.pop()
-            return str(common_dir).replace("\\", "/")
-
-        # Sources are in different directories - return None
-        return None
+        return to_posix_path(common_dir)
 
-    def _convert_axis(self, axis: AxisDescriptor) -> DSSAxis:
+    def _convert_axis(
+        self, axis: AxisDescriptor, map_pairs: Optional[List[Tuple[float, float]]] = None
+    ) -> DSSAxis:
         """Convert DesignSpace axis to DSS axis"""
         # Handle discrete axes (like italic)
-        if hasattr(axis, "values") and axis.values:
-            values = list(axis.values)
+        values = getattr(axis, "values", None)
+        if values:
             minimum = min(values)
             maximum = max(values)
             default = getattr(axis, "default", minimum)
@@ -184,17 +233,10 @@ class DesignSpaceToDSS:
         )
 
         # Process mappings and labels
-        mappings_dict = {}
-
         # Collect mappings
-        if axis.map:
-            for mapping in axis.map:
-                if hasattr(mapping, "inputLocation"):
-                    user_val = mapping.inputLocation
-                    design_val = mapping.outputLocation
-                else:
-                    user_val, design_val = mapping
-                mappings_dict[user_val] = design_val
+        if map_pairs is None:
+            map_pairs = self._axis_map_pairs(axis)
+        mappings_dict = dict(map_pairs)
 
         # Collect labels and create mappings
         if axis.axisLabels:
@@ -224,7 +266,7 @@ class DesignSpaceToDSS:
                 dss_axis.mappings.append(mapping)
 
         # Sort mappings by user value
-        dss_axis.mappings.sort(key=lambda m: m.user_value)
+        dss_axis.mappings.sort(key=attrgetter("user_value"))
 
         return dss_axis
 
@@ -233,38 +275,42 @@ class DesignSpaceToDSS:
         source: SourceDescriptor,
         ds_doc: DesignSpaceDocument,
         sources_path: Optional[str] = None,
+        axes_meta: Optional[List[_AxisDefault]] = None,
+        axis_defaults: Optional[Dict[str, float]] = None,
     ) -> DSSSource:
         """Convert DesignSpace source to DSS source"""
-        filename = source.filename or ""
-        name = Path(filename).stem
+        filename = to_posix_path(source.filename or "")
+        # filename is already in forward-slash form, so posixpath suffices on every OS
+        name = posixpath.splitext(posixpath.basename(filename.rstrip("/")))[0]
 
         # If we have a common sources path, strip it from the filename
-        if sources_path and filename.startswith(sources_path):
-            filename = filename[len(sources_path) :].lstrip("/")
+        # (only at a directory boundary - "masters2.ufo" is not inside "masters")
+        if sources_path:
+            prefix = sources_path.rstrip("/") + "/"
+            if filename.startswith(prefix):
+                filename = filename[len(prefix) :].lstrip("/")
 
         # Determine if this is a base source by checking if coordinates match defaults
         # Base source has coordinates matching default values in design space
-        is_base = self._is_default_source(source, ds_doc)
+        is_base = self._is_default_source(source, ds_doc, axes_meta)
 
         # Detect sparse master: either by name="sparse.*" prefix (DesignSpace convention)
         # or by filename "-sparse.ufo" suffix (filename convention)
+        # (checks the normalized filename from above)
         name_attr = (source.name or "").lower()
-        fname_lower = (source.filename or "").lower()
-        is_sparse = name_attr.startswith("sparse.") or fname_lower.endswith("-sparse.ufo")
+        is_sparse = name_attr.startswith("sparse.") or filename.lower().endswith("-sparse.ufo")
 
         # Build complete location with ALL coordinates from source
         # Include both visible and hidden axis coordinates
         # In DesignSpace, missing coordinate means default value
-        complete_location = {}
-
         # First, add defaults for all axes (visible and hidden)
-        for axis in ds_doc.axes:
-            complete_location[axis.name] = axis.default
+        if axis_defaults is None:
+            axis_defaults = {axis.name: axis.default for axis in ds_doc.axes}
+        complete_location = dict(axis_defaults)
 
         # Then, override with actual source coordinates
         # This preserves ALL coordinates including hidden axes
-        for axis_name, value in source.location.items():
-            complete_location[axis_name] = value
+        complete_location.update(source.location)
 
         return DSSSource(
             name=name,
@@ -279,47 +325,83 @@ class DesignSpaceToDSS:
             layer=source.layerName,  # UFO layer name (None = default layer)
         )
 
-    def _is_default_source(self, source: SourceDescriptor, ds_doc: DesignSpaceDocument) -> bool:
+    def _default_source_axes(
+        self,
+        ds_doc: DesignSpaceDocument,
+        axis_map_pairs: Optional[List[List[Tuple[float, float]]]] = None,
+    ) -> List[_AxisDefault]:
+        """Per-axis data needed to recognise base sources, computed once per document.
+
+        Each entry is (interned axis name, user default, valid values for discrete axes or None,
+        default converted through the axis map to design space).
+        axis_map_pairs optionally gives the normalized map of each axis, in axis order.
+        """
+        if axis_map_pairs is None:
+            axis_map_pairs = [self._axis_map_pairs(axis) for axis in ds_doc.axes]
+
+        axes_meta = []
+        for axis, map_pairs in zip(ds_doc.axes, axis_map_pairs):
+            values = getattr(axis, "values", None)
+            axes_meta.append(
+                (
+                    sys.intern(axis.name),
+                    axis.default,
+                    frozenset(values) if values else None,
+                    float(self._compute_default_design(axis, map_pairs)),
+                )
+            )
+        return axes_meta
+
+    @staticmethod
+    def _axis_map_pairs(axis: AxisDescriptor) -> List[Tuple[float, float]]:
+        """Return axis map as (user, design) pairs
+
+        Map entries are either (input, output) tuples or mapping descriptors; all entries
+        of one axis have the same type, so it is detected once from the first entry.
+        """
+        axis_map = getattr(axis, "map", None)
+        if not axis_map:
+            return []
+        if hasattr(axis_map[0], "inputLocation"):
+            return [(m.inputLocation, m.outputLocation) for m in axis_map]
+        return [tuple(m) for m in axis_map]
+
+    def _compute_default_design(
+        self, axis: AxisDescriptor, map_pairs: Optional[List[Tuple[float, float]]] = None
+    ) -> float:
+        """Convert a continuous axis default from user space to design space"""
+        if map_pairs is None:
+            map_pairs = self._axis_map_pairs(axis)
+        # First mapping for a user value wins
+        user_to_design = dict(reversed(map_pairs))
+        return user_to_design.get(axis.default, axis.default)
+
+    def _is_default_source(
+        self,
+        source: SourceDescriptor,
+        ds_doc: DesignSpaceDocument,
+        axes_meta: Optional[List[_AxisDefault]] = None,
+    ) -> bool:
         """Check if a source is at the default location for all continuous axes.
         For discrete axes, any value is acceptable - we need base sources for each discrete value."""
+        if axes_meta is None:
+            axes_meta = self._default_source_axes(ds_doc)
 
-        for axis in ds_doc.axes:
-            axis_name = axis.name
-
+        location = source.location
+        for axis_name, axis_default, discrete_values, default_design in axes_meta:
             # Get source's coordinate in design space
             # Missing coordinate means default value (standard DesignSpace behavior)
-            source_coord = source.location.get(axis_name)
+            source_coord = location.get(axis_name)
             if source_coord is None:
-                source_coord = axis.default
+                source_coord = axis_default
 
-            # Skip discrete axes - they can have any value
+            # Discrete axes can have any valid value
             # We need base sources for each discrete value (e.g., both Roman and Italic)
-            if hasattr(axis, "values") and axis.values:
-                # Just check that the value is valid
-                if source_coord not in axis.values:
+            if discrete_values is not None:
+                if source_coord not in discrete_values:
                     return False
                 continue
 
-            # For continuous axes, check if at default position
-            default_user = axis.default
-
-            # Convert user space default to design space
-            default_design = default_user  # Default: no mapping
-
-            # Check if axis has mappings
-            if hasattr(axis, "map") and axis.map:
-                # Find the mapping for default user value
-                for mapping in axis.map:
-                    if hasattr(mapping, "inputLocation"):
-                        user_val = mapping.inputLocation
-                        design_val = mapping.outputLocation
-                    else:
-                        user_val, design_val = mapping
-
-                    if user_val == default_user:
-                        default_design = design_val
-                        break
-
             # For continuous axes, compare with small tolerance for floating point
             if abs(source_coord - default_design) > 0.001:
                 return False
@@ -335,7 +417,7 @@ class DesignSpaceToDSS:
             familyname=instance.familyName or "",
             stylename=instance.styleName or "",
             filename=instance.filename,
-            location=dict(instance.location),
+            location=instance.location.copy(),
         )
 
     def _convert_rule(self, rule: RuleDescriptor, ds_doc: DesignSpaceDocument) -> Optional[DSSRule]:
@@ -343,30 +425,27 @@ class DesignSpaceToDSS:
         if not rule.subs:
             return None
 
-        substitutions = []
-        for sub in rule.subs:
-            substitutions.append((sub[0], sub[1]))
-
-        conditions = []
-        if hasattr(rule, "conditionSets") and rule.conditionSets:
-            for condset in rule.conditionSets:
-                for condition in condset:
-                    conditions.append(
-                        {
-                            "axis": condition["name"],
-                            "minimum": condition.get("minimum", 0),
-                            "maximum": condition.get("maximum", 1000),
-                        }
-                    )
-        elif hasattr(rule, "conditions"):
-            for condition in rule.conditions:
-                conditions.append(
-                    {
-                        "axis": condition.name,
-                        "minimum": condition.minimum,
-                        "maximum": condition.maximum,
-                    }
-                )
+        substitutions = [(sub[0], sub[1]) for sub in rule.subs]
+
+        if _HAS_CONDITION_SETS:
+            conditions = [
+                {
+                    "axis": condition["name"],
+                    "minimum": condition.get("minimum", 0),
+                    "maximum": condition.get("maximum", 1000),
+                }
+                for condset in rule.conditionSets
+                for condition in condset
+            ]
+        else:
+            conditions = [
+                {
+                    "axis": condition.name,
+                    "minimum": condition.minimum,
+                    "maximum": condition.maximum,
+                }
+                for condition in getattr(rule, "conditions", ())
+            ]
 
         return DSSRule(name=rule.name or "rule", substitutions=substitutions, conditions=conditions)
 
@@ -374,7 +453,12 @@ class DesignSpaceToDSS:
     # avar2 CONVERSION METHODS
     # ============================================================
 
-    def _convert_avar2_mapping(self, mapping, ds_doc: DesignSpaceDocument) -> DSSAvar2Mapping:
+    def _convert_avar2_mapping(
+        self,
+        mapping,
+        ds_doc: DesignSpaceDocument,
+        tags_by_name: Optional[Dict[str, str]] = None,
+    ) -> DSSAvar2Mapping:
         """Convert DesignSpace AxisMappingDescriptor to DSS avar2 mapping
 
         DesignSpace format:
@@ -389,21 +473,25 @@ class DesignSpaceToDSS:
         # Get mapping name/description
         name = getattr(mapping, 'description', None)
 
+        if tags_by_name is None:
+            tags_by_name = self._axis_tags_by_name(ds_doc)
+
         # Convert input location (axis name -> value)
+        # Axis names are converted to tags where possible for shorter output
         input_location = {}
         if hasattr(mapping, 'inputLocation') and mapping.inputLocation:
-            for axis_name, value in mapping.inputLocation.items():
-                # Convert to axis tag if possible for shorter output
-                axis_tag = self._get_axis_tag(axis_name, ds_doc)
-                input_location[axis_tag] = value
+            input_location = {
+                tags_by_name.get(axis_name, axis_name): value
+                for axis_name, value in mapping.inputLocation.items()
+            }
 
         # Convert output location (axis name -> value)
         output_location = {}
         if hasattr(mapping, 'outputLocation') and mapping.outputLocation:
-            for axis_name, value in mapping.outputLocation.items():
-                # Convert to axis tag if possible
-                axis_tag = self._get_axis_tag(axis_name, ds_doc)
-                output_location[axis_tag] = value
+            output_location = {
+                tags_by_name.get(axis_name, axis_name): value
+                for axis_name, value in mapping.outputLocation.items()
+            }
 
         return DSSAvar2Mapping(
             name=name,
@@ -411,55 +499,40 @@ class DesignSpaceToDSS:
             output=output_location
         )
 
-    def _get_axis_tag(self, axis_name: str, ds_doc: DesignSpaceDocument) -> str:
-        """Get axis tag from axis name
+    def _axis_tags_by_name(self, ds_doc: DesignSpaceDocument) -> Dict[str, str]:
+        """Map axis names to axis tags
 
-        Returns the axis tag if found, otherwise returns the original name.
+        Names missing from the result are kept as-is by callers.
         """
+        tags_by_name = {}
         for axis in ds_doc.axes:
-            if axis.name == axis_name:
-                return axis.tag
-        return axis_name
+            # First axis with a given name wins; tags are interned since they become
+            # the keys of every avar2 location and of the variable tally
+            tags_by_name.setdefault(axis.name, sys.intern(axis.tag))
+        return tags_by_name
 
-    def _collect_avar2_input_axes(self, ds_doc: DesignSpaceDocument) -> set:
-        """Collect all axis names/tags that appear in avar2 INPUT locations.
+    def _collect_avar2_axes(self, ds_doc: DesignSpaceDocument) -> Tuple[set, set]:
+        """Collect all axis names/tags that appear in avar2 INPUT and OUTPUT locations.
 
-        Axes in input are user-controllable (visible axes).
+        Axes in input are user-controllable (visible axes). Axes only in output
+        (never in input) are typically hidden parametric axes.
 
         Returns:
-            Set of axis names that appear in any avar2 input location.
+            Tuple of (input_axes, output_axes) sets, collected in one pass over the mappings.
         """
         input_axes = set()
-
-        if not hasattr(ds_doc, 'axisMappings') or not ds_doc.axisMappings:
-            return input_axes
-
-        for mapping in ds_doc.axisMappings:
-            if hasattr(mapping, 'inputLocation') and mapping.inputLocation:
-                for axis_name in mapping.inputLocation.keys():
-                    input_axes.add(axis_name)
-
-        return input_axes
-
-    def _collect_avar2_output_axes(self, ds_doc: DesignSpaceDocument) -> set:
-        """Collect all axis names/tags that appear in avar2 OUTPUT locations.
-
-        Axes only in output (never in input) are typically hidden parametric axes.
-
-        Returns:
-            Set of axis names that appear in any avar2 output location.
-        """
         output_axes = set()
 
-        if not hasattr(ds_doc, 'axisMappings') or not ds_doc.axisMappings:
-            return output_axes
+        if not _HAS_AXIS_MAPPINGS or not ds_doc.axisMappings:
+            return input_axes, output_axes
 
         for mapping in ds_doc.axisMappings:
+            if hasattr(mapping, 'inputLocation') and mapping.inputLocation:
+                input_axes.update(mapping.inputLocation)
             if hasattr(mapping, 'outputLocation') and mapping.outputLocation:
-                for axis_name in mapping.outputLocation.keys():
-                    output_axes.add(axis_name)
+                output_axes.update(mapping.outputLocation)
 
-        return output_axes
+        return input_axes, output_axes
 
     def _determine_hidden_axes(self, ds_doc: DesignSpaceDocument) -> set:
         """Determine which axes should be hidden based on avar2 usage.
@@ -475,8 +548,11 @@ class DesignSpaceToDSS:
         hidden_axes = set()
 
         # Collect axes from avar2 mappings
-        input_axes = self._collect_avar2_input_axes(ds_doc)
-        output_axes = self._collect_avar2_output_axes(ds_doc)
+        input_axes, output_axes = self._collect_avar2_axes(ds_doc)
+
+        # Without avar2 outputs only the explicit attribute can hide an axis
+        if not output_axes:
+            return {axis.name for axis in ds_doc.axes if getattr(axis, 'hidden', False)}
 
         for axis in ds_doc.axes:
             # Priority 1: explicit hidden attribute
@@ -494,7 +570,9 @@ class DesignSpaceToDSS:
 
         return hidden_axes
 
-    def _extract_avar2_variables_from_dss(self, dss_mappings, threshold: int = 3) -> tuple:
+    def _extract_avar2_variables_from_dss(
+        self, dss_mappings: List[DSSAvar2Mapping], threshold: int = 3
+    ) -> Tuple[Dict[str, float], Dict[str, int]]:
         """Extract repeated values from CONVERTED DSS avar2 mappings to create variables
 
         If a value appears threshold+ times across all output locations,
@@ -515,77 +593,32 @@ class DesignSpaceToDSS:
                 - counts: Dict of variable_name -> frequency count
         """
         # Count value occurrences per axis
-        axis_value_counts = {}  # {axis_tag: {value: count}}
-
-        for mapping in dss_mappings:
-            for axis_tag, value in mapping.output.items():
-                if axis_tag not in axis_value_counts:
-                    axis_value_counts[axis_tag] = {}
-                if value not in axis_value_counts[axis_tag]:
-                    axis_value_counts[axis_tag][value] = 0
-                axis_value_counts[axis_tag][value] += 1
+        axis_value_counts = self._count_output_values(mapping.output for mapping in dss_mappings)
 
         # Create variables for values that appear threshold+ times
         variables = {}
         counts = {}
-        axis_counters = {}  # Track counter per axis
 
         for axis_tag, value_counts in axis_value_counts.items():
-            # Sort by count descending to get most common values first
-            sorted_values = sorted(value_counts.items(), key=lambda x: -x[1])
-
-            for value, count in sorted_values:
-                if count >= threshold:
-                    # Increment counter for this axis
-                    if axis_tag not in axis_counters:
-                        axis_counters[axis_tag] = 0
-                    axis_counters[axis_tag] += 1
+            # Most common values first (ties keep first-seen order)
+            counter = 0
+            for value, count in value_counts.most_common():
+                if count < threshold:
+                    break
 
-                    # Use axis tag + counter as variable name
-                    var_name = f"{axis_tag}{axis_counters[axis_tag]}"
-                    variables[var_name] = value
-                    counts[var_name] = count
+                # Use axis tag + counter as variable name
+                counter += 1
+                var_name = f"{axis_tag}{counter}"
+                variables[var_name] = value
+                counts[var_name] = count
 
         return variables, counts
 
-    def _extract_avar2_variables(self, axis_mappings) -> dict:
-        """Extract repeated values from avar2 mappings to create variables
-
-        If a value appears 3+ times across all output locations,
-        create a variable for it named after the axis TAG (not name).
-
-        Example:
-            If wght=600 appears in 10 mappings, create $wght = 600
-            This allows using the shorthand wght=$ in output
-
-        Returns:
-            Dict of variable_name (axis tag) -> value (without $ prefix)
-        """
-        # Count value occurrences per axis (using output keys which are axis tags)
-        axis_value_counts = {}  # {axis_tag: {value: count}}
-
-        for mapping in axis_mappings:
-            if hasattr(mapping, 'outputLocation') and mapping.outputLocation:
-                for axis_tag, value in mapping.outputLocation.items():
-                    if axis_tag not in axis_value_counts:
-                        axis_value_counts[axis_tag] = {}
-                    if value not in axis_value_counts[axis_tag]:
-                        axis_value_counts[axis_tag][value] = 0
-                    axis_value_counts[axis_tag][value] += 1
-
-        # Create variables for values that appear 3+ times
-        variables = {}
-        for axis_tag, value_counts in axis_value_counts.items():
-            # Find the value with the most occurrences
-            max_count = 0
-            max_value = None
-            for value, count in value_counts.items():
-                if count > max_count:
-                    max_count = count
-                    max_value = value
-
-            if max_count >= 3 and max_value is not None:
-                # Use axis tag as variable name (allows $AXIS shorthand)
-                variables[axis_tag] = max_value
-
-        return variables
+    @staticmethod
+    def _count_output_values(output_locations: Iterable[Dict[str, float]]) -> Dict[str, Counter]:
+        """Count how often each value occurs per axis across avar2 output locations"""
+        axis_value_counts = defaultdict(Counter)  # {axis_tag: Counter({value: count})}
+        for location in output_locations:
+            for axis_tag, value in location.items():
+                axis_value_counts[axis_tag][value] += 1
+        return axis_value_counts
@@ -10,11 +10,12 @@ This module converts DSS documents back to DesignSpace format and includes metho
 5. UFO file reading capabilities for glyph name extraction
 """
 
+import os
+import plistlib
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Tuple
-
-# UFO reading
-from defcon import Font
+from typing import AbstractSet, Dict, Iterable, List, Optional, Tuple, Union
 
 # FontTools imports
 from fontTools.designspaceLib import (
@@ -39,15 +40,37 @@ from ..core.validation import UFOGlyphExtractor
 from ..utils.logging import DSSketchLogger
 
 # Import utility classes
+from ..utils.paths import to_posix_path
 from ..utils.patterns import PatternMatcher
 
+# Standard axis names and the tags/names rule conditions may use for them
+_AXIS_NAME_VARIATIONS = {
+    "weight": ["wght", "weight"],
+    "width": ["wdth", "width"],
+    "italic": ["ital", "italic"],
+    "slant": ["slnt", "slant"],
+    "optical": ["opsz", "optical"],
+}
+
+# Characters dropped from family/style names when building PostScript names
+_PS_NAME_STRIP = str.maketrans("", "", " -")
+
+# Axis names that become DiscreteAxisDescriptor when their range is 0:1
+_DISCRETE_AXIS_NAMES = frozenset({"italic", "ital"})
+
 
 class DSSToDesignSpace:
     """Convert DSS to DesignSpace format"""
 
+    # familyName/styleName per UFO path: path -> (fontinfo.plist fingerprint, info)
+    _ufo_info_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Optional[str]]]] = {}
+
+    # Read UFO names in worker threads when a document references at least this many UFOs
+    PARALLEL_MIN_UFOS = 8
+
     def __init__(self, base_path: Optional[Path] = None):
         """Initialize converter with optional base path for UFO files"""
-        self.base_path = base_path
+        self.base_path = Path(base_path) if base_path else base_path
         self.logger = DSSketchLogger()
 
     def _detect_family_name(self, dss_doc: DSSDocument) -> str:
@@ -90,8 +113,7 @@ class DSSToDesignSpace:
                 self.logger.warning(f"UFO not found at '{ufo_path}' - using 'Unknown' as family name")
                 return "Unknown"
 
-            font = Font(str(ufo_path))
-            family_name = font.info.familyName
+            family_name = self._read_fontinfo(ufo_path).get("familyName")
 
             if family_name:
                 self.logger.info(f"Detected family name '{family_name}' from {ufo_path.name}")
@@ -110,52 +132,73 @@ class DSSToDesignSpace:
         # Detect family name if not specified
         dss_doc.family = self._detect_family_name(dss_doc)
 
+        # Descriptors are added in bulk - DesignSpaceDocument.addX() only appends
+
         # Convert regular axes
-        for dss_axis in dss_doc.axes:
-            axis = self._convert_axis(dss_axis)
-            doc.addAxis(axis)
+        doc.axes.extend(self._convert_axis(dss_axis) for dss_axis in dss_doc.axes)
 
         # Convert hidden axes (avar2)
-        for dss_axis in dss_doc.hidden_axes:
-            axis = self._convert_hidden_axis(dss_axis)
-            doc.addAxis(axis)
+        doc.axes.extend(self._convert_hidden_axis(dss_axis) for dss_axis in dss_doc.hidden_axes)
 
         # Convert avar2 mappings
         if dss_doc.avar2_mappings:
-            for dss_mapping in dss_doc.avar2_mappings:
-                mapping = self._convert_avar2_mapping(dss_mapping, dss_doc)
-                doc.axisMappings.append(mapping)
+            doc.axisMappings.extend(
+                self._convert_avar2_mapping(dss_mapping, dss_doc)
+                for dss_mapping in dss_doc.avar2_mappings
+            )
 
-        # Convert sources
-        for source_index, dss_source in enumerate(dss_doc.sources, 1):
-            source = self._convert_source(dss_source, dss_doc, source_index)
-            doc.addSource(source)
+        # Convert sources (axis tag/name lookup is built once for all of them,
+        # UFO names are read up front so the reads can overlap)
+        tag_to_name = self._axis_tag_to_name(dss_doc)
+        sources_prefix = self._sources_prefix(dss_doc)
+        ufo_infos = self._read_ufo_infos(
+            [sources_prefix + dss_source.filename for dss_source in dss_doc.sources]
+        )
+        convert_source = self._convert_source
+        doc.sources.extend(
+            convert_source(
+                dss_source, dss_doc, source_index, tag_to_name, ufo_infos, sources_prefix
+            )
+            for source_index, dss_source in enumerate(dss_doc.sources, 1)
+        )
 
         # Convert instances (skip if instances_off is set)
         if not dss_doc.instances_off:
             if dss_doc.instances_auto:
                 # Use sophisticated instance generation from instances module
-                enhanced_doc, _ = createInstances(
+                # Only the generated instances are kept; the working copy of the
+                # document createInstances() builds is released right away
+                doc.instances = createInstances(
                     doc,
                     dss_doc=dss_doc,
                     defaultFolder="instances",
                     skipFilter={},
                     skipList=dss_doc.instances_skip if dss_doc.instances_skip else None,
                     filterInstances={}
-                )
-                # Copy the generated instances back to our document
-                doc.instances = enhanced_doc.instances
+                )[0].instances
             else:
                 # Use explicit instances from DSS document
-                for dss_instance in dss_doc.instances:
-                    instance = self._convert_instance(dss_instance, dss_doc)
-                    doc.addInstance(instance)
+                ps_families = {}  # PostScript family names, shared across instances
+                convert_instance = self._convert_instance
+                doc.instances.extend(
+                    convert_instance(dss_instance, dss_doc, ps_families)
+                    for dss_instance in dss_doc.instances
+                )
 
-        # Convert rules
-        for dss_rule in dss_doc.rules:
-            rule = self._convert_rule(dss_rule, doc)
-            if rule:
-                doc.addRule(rule)
+        # Convert rules (condition axis names resolve through one index per document,
+        # UFO glyph names are read once for all wildcard rules)
+        if dss_doc.rules:
+            axis_index = self._axis_name_index(doc)
+            all_glyphs = None
+            if any(dss_rule.pattern and dss_rule.to_pattern for dss_rule in dss_doc.rules):
+                all_glyphs = frozenset(
+                    UFOGlyphExtractor.get_all_glyphs_from_sources(doc.sources, self.base_path)
+                )
+            rules = (
+                self._convert_rule(dss_rule, doc, axis_index, all_glyphs)
+                for dss_rule in dss_doc.rules
+            )
+            doc.rules.extend(rule for rule in rules if rule)
 
         return doc
 
@@ -165,22 +208,13 @@ class DSSToDesignSpace:
         is_discrete = (
             dss_axis.minimum == 0
             and dss_axis.maximum == 1
-            and dss_axis.name.lower() in ["italic", "ital"]
+            and dss_axis.name.lower() in _DISCRETE_AXIS_NAMES
         )
 
         if is_discrete:
             # Create DiscreteAxisDescriptor for discrete axes
             axis = DiscreteAxisDescriptor()
-            # Use display_name if available, otherwise fall back to name
-            axis.name = dss_axis.display_name if dss_axis.display_name else dss_axis.name
-            axis.tag = dss_axis.tag
-            # For labelNames, use display_name if available
-            if dss_axis.display_name:
-                axis.labelNames = {"en": dss_axis.display_name}
-            elif dss_axis.tag.isupper():
-                axis.labelNames = {"en": dss_axis.name}
-            else:
-                axis.labelNames = {"en": dss_axis.name.title()}
+            self._set_axis_names(axis, dss_axis)
             axis.values = [0, 1]
             axis.default = dss_axis.default
 
@@ -204,40 +238,49 @@ class DSSToDesignSpace:
         else:
             # Create regular AxisDescriptor for continuous axes
             axis = AxisDescriptor()
-            # Use display_name if available, otherwise fall back to name
-            axis.name = dss_axis.display_name if dss_axis.display_name else dss_axis.name
-            axis.tag = dss_axis.tag
-            # For labelNames, use display_name if available
-            if dss_axis.display_name:
-                axis.labelNames = {"en": dss_axis.display_name}
-            elif dss_axis.tag.isupper():
-                axis.labelNames = {"en": dss_axis.name}  # WDSP, GRAD, etc.
-            else:
-                axis.labelNames = {"en": dss_axis.name.title()}  # Weight, Italic, etc.
+            self._set_axis_names(axis, dss_axis)
             axis.minimum = dss_axis.minimum
             axis.default = dss_axis.default
             axis.maximum = dss_axis.maximum
 
-            # Continuous axis - add mappings and labels
+            # Continuous axis - add mappings and labels in a single pass
             axis.map = []
             axis.axisLabels = []
+            map_append = axis.map.append
+            label_append = axis.axisLabels.append
 
             for mapping in dss_axis.mappings:
+                user_value = mapping.user_value
                 # Add mapping as tuple (older format)
-                axis.map.append((mapping.user_value, mapping.design_value))
+                map_append((user_value, mapping.design_value))
 
                 # Add label only if it's not empty
                 # (pure numeric mappings like opsz don't have labels)
                 if mapping.label:
-                    label_desc = AxisLabelDescriptor(
-                        name=mapping.label,
-                        userValue=mapping.user_value,
-                        elidable=mapping.elidable,
+                    label_append(
+                        AxisLabelDescriptor(
+                            name=mapping.label,
+                            userValue=user_value,
+                            elidable=mapping.elidable,
+                        )
                     )
-                    axis.axisLabels.append(label_desc)
 
         return axis
 
+    @staticmethod
+    def _set_axis_names(axis, dss_axis: DSSAxis) -> None:
+        """Set name, tag and labelNames shared by discrete and continuous axes"""
+        # Use display_name if available, otherwise fall back to name
+        axis.name = dss_axis.display_name if dss_axis.display_name else dss_axis.name
+        axis.tag = dss_axis.tag
+        # For labelNames, use display_name if available
+        if dss_axis.display_name:
+            axis.labelNames = {"en": dss_axis.display_name}
+        elif dss_axis.tag.isupper():
+            axis.labelNames = {"en": dss_axis.name}  # WDSP, GRAD, etc.
+        else:
+            axis.labelNames = {"en": dss_axis.name.title()}  # Weight, Italic, etc.
+
     def _convert_hidden_axis(self, dss_axis: DSSAxis) -> AxisDescriptor:
         """Convert DSS hidden axis to DesignSpace axis with hidden=True
 
@@ -371,21 +414,34 @@ class DSSToDesignSpace:
         )
         return axis_key
 
+    def _axis_tag_to_name(self, dss_doc: DSSDocument) -> Dict[str, str]:
+        """Map axis tags and names to the axis name used in DesignSpace locations
+
+        fontTools uses axis.name, which is display_name when available.
+        """
+        tag_to_name = {}
+        for axis in dss_doc.axes + dss_doc.hidden_axes:
+            axis_name = axis.display_name if axis.display_name else axis.name
+            tag_to_name[axis.tag] = axis_name
+            tag_to_name[axis.name] = axis_name  # Also map name to itself
+        return tag_to_name
+
     def _convert_source(
-        self, dss_source: DSSSource, dss_doc: DSSDocument, source_index: int
+        self,
+        dss_source: DSSSource,
+        dss_doc: DSSDocument,
+        source_index: int,
+        tag_to_name: Optional[Dict[str, str]] = None,
+        ufo_infos: Optional[Dict[str, Optional[dict]]] = None,
+        sources_prefix: Optional[str] = None,
     ) -> SourceDescriptor:
         """Convert DSS source to DesignSpace source"""
         source = SourceDescriptor()
 
         # If path is specified in DSS document, prepend it to filename
-        if dss_doc.path:
-            # Ensure path uses forward slashes for consistency
-            path = dss_doc.path.replace("\\", "/")
-            if not path.endswith("/"):
-                path += "/"
-            source.filename = path + dss_source.filename
-        else:
-            source.filename = dss_source.filename
+        if sources_prefix is None:
+            sources_prefix = self._sources_prefix(dss_doc)
+        source.filename = sources_prefix + dss_source.filename
 
         # Assign automatic name (sparse masters get "sparse." prefix for round-trip preservation)
         if dss_source.is_sparse:
@@ -397,25 +453,21 @@ class DSSToDesignSpace:
         source.familyName = dss_doc.family
 
         # Try to read styleName from UFO file, fall back to DSS source name
-        ufo_info = self._read_ufo_info(source.filename)
+        if ufo_infos is not None and source.filename in ufo_infos:
+            ufo_info = ufo_infos[source.filename]
+        else:
+            ufo_info = self._read_ufo_info(source.filename)
         if ufo_info and ufo_info.get("styleName"):
             source.styleName = ufo_info.get("styleName")
         else:
             source.styleName = dss_source.name
 
         # Convert location keys from tags to axis names (fontTools uses axis.name)
-        # Build mapping: tag -> axis_name (display_name if available, else name)
-        tag_to_name = {}
-        for axis in dss_doc.axes + dss_doc.hidden_axes:
-            axis_name = axis.display_name if axis.display_name else axis.name
-            tag_to_name[axis.tag] = axis_name
-            tag_to_name[axis.name] = axis_name  # Also map name to itself
-
-        source.location = {}
-        for key, value in dss_source.location.items():
-            # Convert tag to axis name if needed
-            axis_name = tag_to_name.get(key, key)
-            source.location[axis_name] = value
+        if tag_to_name is None:
+            tag_to_name = self._axis_tag_to_name(dss_doc)
+        source.location = {
+            tag_to_name.get(key, key): value for key, value in dss_source.location.items()
+        }
 
         # Set copy flags
         if dss_source.is_base:
@@ -430,28 +482,91 @@ class DSSToDesignSpace:
 
         return source
 
+    @staticmethod
+    def _sources_prefix(dss_doc: DSSDocument) -> str:
+        """Prefix for source filenames: the document's sources path with a trailing slash"""
+        if not dss_doc.path:
+            return ""
+        # Ensure path uses forward slashes for consistency
+        path = to_posix_path(dss_doc.path)
+        if not path.endswith("/"):
+            path += "/"
+        return path
+
+    def _read_ufo_infos(self, filenames: List[str]) -> Dict[str, Optional[dict]]:
+        """Read UFO family/style names for several sources, each UFO once
+
+        Reads run in worker threads when enough distinct UFOs are referenced.
+        """
+        unique_filenames = list(dict.fromkeys(filenames))
+        if len(unique_filenames) >= self.PARALLEL_MIN_UFOS:
+            with ThreadPoolExecutor(max_workers=min(32, len(unique_filenames))) as executor:
+                return dict(
+                    zip(unique_filenames, executor.map(self._read_ufo_info, unique_filenames))
+                )
+        return {filename: self._read_ufo_info(filename) for filename in unique_filenames}
+
+    @staticmethod
+    def _read_fontinfo(ufo_path: Union[str, Path]) -> dict:
+        """Read a UFO's fontinfo.plist (empty if the UFO has none)
+
+        Only the plist is parsed; names are the same in UFO 2 and UFO 3, so there is
+        no need to open the whole font.
+        """
+        try:
+            with open(os.path.join(ufo_path, "fontinfo.plist"), "rb") as f:
+                return plistlib.load(f)
+        except FileNotFoundError:
+            return {}
+
     def _read_ufo_info(self, filename: str) -> Optional[dict]:
-        """Read familyName and styleName from UFO file"""
+        """Read familyName and styleName from UFO file
+
+        Results are cached per process and reused while the UFO's fontinfo.plist
+        is unchanged, so converting the same document again does not reopen its UFOs.
+        """
         try:
             # The filename already includes the full relative path from the base_path
-            # (e.g., "sources/SuperFont-Black.ufo")
-            ufo_path = Path(filename)
-            if self.base_path and not ufo_path.is_absolute():
-                ufo_path = self.base_path / filename
+            # (e.g., "sources/SuperFont-Black.ufo"); plain os.path string operations
+            # are enough here, this runs once per source
+            ufo_path = filename
+            if self.base_path and not os.path.isabs(filename):
+                ufo_path = os.path.join(self.base_path, filename)
 
-            if not ufo_path.exists() or not ufo_path.is_dir():
+            if not os.path.isdir(ufo_path):
                 return None
 
-            font = Font(str(ufo_path))
-            return {"familyName": font.info.familyName, "styleName": font.info.styleName}
+            try:
+                stat = os.stat(os.path.join(ufo_path, "fontinfo.plist"))
+                fingerprint = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                fingerprint = None
+
+            key = ufo_path
+            cached = DSSToDesignSpace._ufo_info_cache.get(key)
+            if cached is not None and fingerprint is not None and cached[0] == fingerprint:
+                return dict(cached[1])
+
+            fontinfo = self._read_fontinfo(ufo_path)
+            info = {name: fontinfo.get(name) for name in ("familyName", "styleName")}
+            if fingerprint is not None:
+                DSSToDesignSpace._ufo_info_cache[key] = (fingerprint, info)
+            return dict(info)
         except Exception:
             # If UFO reading fails, return None to fall back to defaults
             return None
 
     def _convert_instance(
-        self, dss_instance: DSSInstance, dss_doc: DSSDocument
+        self,
+        dss_instance: DSSInstance,
+        dss_doc: DSSDocument,
+        ps_families: Optional[Dict[str, str]] = None,
     ) -> InstanceDescriptor:
-        """Convert DSS instance to DesignSpace instance"""
+        """Convert DSS instance to DesignSpace instance
+
+        ps_families caches PostScript family names by family name, so instances
+        sharing a family don't rebuild it.
+        """
         instance = InstanceDescriptor()
         instance.familyName = dss_instance.familyname or dss_doc.family
         instance.styleName = dss_instance.stylename
@@ -459,14 +574,23 @@ class DSSToDesignSpace:
         instance.location = dss_instance.location.copy()
 
         # Generate PostScript name
-        ps_family = instance.familyName.replace(" ", "").replace("-", "")
-        ps_style = instance.styleName.replace(" ", "").replace("-", "")
+        if ps_families is None:
+            ps_families = {}
+        ps_family = ps_families.get(instance.familyName)
+        if ps_family is None:
+            ps_family = instance.familyName.translate(_PS_NAME_STRIP)
+            ps_families[instance.familyName] = ps_family
+        ps_style = instance.styleName.translate(_PS_NAME_STRIP)
         instance.postScriptFontName = f"{ps_family}-{ps_style}"
 
         return instance
 
     def _convert_rule(
-        self, dss_rule: DSSRule, doc: DesignSpaceDocument
+        self,
+        dss_rule: DSSRule,
+        doc: DesignSpaceDocument,
+        axis_index: Optional[Dict[str, str]] = None,
+        all_glyphs: Optional[AbstractSet[str]] = None,
     ) -> Optional[RuleDescriptor]:
         """Convert DSS rule to DesignSpace rule
 
@@ -479,12 +603,12 @@ class DSSToDesignSpace:
         # Handle wildcard patterns
         if dss_rule.pattern and dss_rule.to_pattern:
             # Expand wildcard patterns to concrete substitutions
-            substitutions = self._expand_wildcard_pattern(dss_rule, doc)
+            substitutions = self._expand_wildcard_pattern(dss_rule, doc, all_glyphs)
             # Sort substitutions by source glyph name for consistent output
-            rule.subs = sorted(substitutions, key=lambda x: x[0])
+            rule.subs = sorted(substitutions, key=itemgetter(0))
         else:
             # Use existing substitutions, also sorted
-            rule.subs = sorted(dss_rule.substitutions, key=lambda x: x[0])
+            rule.subs = sorted(dss_rule.substitutions, key=itemgetter(0))
 
         # Skip empty rules (no valid substitutions)
         if not rule.subs:
@@ -498,7 +622,9 @@ class DSSToDesignSpace:
             rule.conditionSets = [[]]  # Create one condition set
             for condition in dss_rule.conditions:
                 # Find correct axis name from DesignSpace document
-                axis_name = self._find_axis_name_in_designspace(condition["axis"], doc)
+                axis_name = self._find_axis_name_in_designspace(
+                    condition["axis"], doc, axis_index
+                )
 
                 cond_dict = {
                     "name": axis_name,
@@ -509,34 +635,45 @@ class DSSToDesignSpace:
 
         return rule
 
-    def _find_axis_name_in_designspace(self, dss_axis_name: str, doc: DesignSpaceDocument) -> str:
+    def _axis_name_index(self, doc: DesignSpaceDocument) -> Dict[str, str]:
+        """Map lowercase axis names, standard names and tags to DesignSpace axis names
+
+        Exact axis names take precedence over standard-name variations.
+        """
+        index = {}
+        for axis in doc.axes:
+            index.setdefault(axis.name.lower(), axis.name)
+
+        for standard_name, variations in _AXIS_NAME_VARIATIONS.items():
+            for axis in doc.axes:
+                if axis.name.lower() == standard_name or axis.tag.lower() in variations:
+                    index.setdefault(standard_name, axis.name)
+                    for variation in variations:
+                        index.setdefault(variation, axis.name)
+                    break
+
+        return index
+
+    def _find_axis_name_in_designspace(
+        self,
+        dss_axis_name: str,
+        doc: DesignSpaceDocument,
+        axis_index: Optional[Dict[str, str]] = None,
+    ) -> str:
         """Find correct axis name in DesignSpace document based on DSS axis name
 
         DSS rules might use capitalized names like 'Weight' or 'Italic'
         but DesignSpace axes use lowercase like 'weight' or 'italic'
         """
-        dss_name_lower = dss_axis_name.lower()
+        if axis_index is None:
+            axis_index = self._axis_name_index(doc)
 
-        # First try exact match with axis.name
-        for axis in doc.axes:
-            if axis.name.lower() == dss_name_lower:
-                return axis.name
-
-        # Then try common variations and tag matching
-        axis_mapping = {
-            "weight": ["wght", "weight"],
-            "width": ["wdth", "width"],
-            "italic": ["ital", "italic"],
-            "slant": ["slnt", "slant"],
-            "optical": ["opsz", "optical"],
-        }
-
-        for standard_name, variations in axis_mapping.items():
-            if dss_name_lower in variations or dss_name_lower == standard_name:
-                # Find matching axis in document
-                for axis in doc.axes:
-                    if axis.name.lower() == standard_name or axis.tag.lower() in variations:
-                        return axis.name
+        # Index keys are lowercase, so names already in lowercase hit without lower()
+        axis_name = axis_index.get(dss_axis_name)
+        if axis_name is None:
+            axis_name = axis_index.get(dss_axis_name.lower())
+        if axis_name is not None:
+            return axis_name
 
         # If no match found, this is an error - rules must reference existing axes
         raise ValueError(
@@ -545,28 +682,27 @@ class DSSToDesignSpace:
         )
 
     def _expand_wildcard_pattern(
-        self, dss_rule: DSSRule, doc: DesignSpaceDocument
+        self,
+        dss_rule: DSSRule,
+        doc: DesignSpaceDocument,
+        all_glyphs: Optional[AbstractSet[str]] = None,
     ) -> List[Tuple[str, str]]:
         """Expand wildcard patterns to concrete glyph substitutions"""
         # Extract all glyph names from UFO files for validation
-        # Ensure base_path is a Path object
-        base_path = (
-            Path(self.base_path)
-            if self.base_path and not isinstance(self.base_path, Path)
-            else self.base_path
-        )
-        all_glyphs = UFOGlyphExtractor.get_all_glyphs_from_sources(doc.sources, base_path)
+        if all_glyphs is None:
+            all_glyphs = UFOGlyphExtractor.get_all_glyphs_from_sources(
+                doc.sources, self.base_path
+            )
 
         if not dss_rule.pattern or not dss_rule.to_pattern:
             # Validate regular substitutions (non-wildcard)
-            validated_substitutions = []
-            for from_glyph, to_glyph in dss_rule.substitutions:
-                if to_glyph in all_glyphs:
-                    validated_substitutions.append((from_glyph, to_glyph))
-                else:
-                    DSSketchLogger.warning(
-                        f"Skipping substitution {from_glyph} -> {to_glyph} - target glyph '{to_glyph}' not found in UFO files"
-                    )
+            validated_substitutions = [
+                (from_glyph, to_glyph)
+                for from_glyph, to_glyph in dss_rule.substitutions
+                if to_glyph in all_glyphs
+            ]
+            if len(validated_substitutions) != len(dss_rule.substitutions):
+                self._warn_missing_targets(dss_rule.substitutions, all_glyphs)
             return validated_substitutions
 
         # For wildcard patterns, all_glyphs is already extracted above
@@ -578,28 +714,38 @@ class DSSToDesignSpace:
         matching_glyphs = PatternMatcher.find_matching_glyphs(patterns, all_glyphs)
 
         # Generate substitutions
-        substitutions = []
         to_suffix = dss_rule.to_pattern
 
-        for glyph in matching_glyphs:
-            if to_suffix.startswith("."):
-                # Append suffix: dollar -> dollar.rvrn
-                # But skip if glyph already has this suffix to avoid .rvrn.rvrn
-                if glyph.endswith(to_suffix):
-                    continue
-                target = glyph + to_suffix
-            else:
-                # Replace with target: might support other patterns in future
-                target = to_suffix
+        if to_suffix.startswith("."):
+            # Append suffix: dollar -> dollar.rvrn
+            # But skip if glyph already has this suffix to avoid .rvrn.rvrn
+            candidates = [
+                (glyph, glyph + to_suffix)
+                for glyph in matching_glyphs
+                if not glyph.endswith(to_suffix)
+            ]
+        else:
+            # Replace with target: might support other patterns in future
+            candidates = [(glyph, to_suffix) for glyph in matching_glyphs]
 
-            # Validate that target glyph exists in the font
-            if target in all_glyphs:
-                substitutions.append((glyph, target))
-            else:
-                # Skip invalid substitutions and warn about missing target glyph
-                DSSketchLogger.warning(
-                    f"Skipping substitution {glyph} -> {target} - target glyph '{target}' not found in UFO files"
-                )
-                pass
+        # Validate that target glyph exists in the font
+        substitutions = [pair for pair in candidates if pair[1] in all_glyphs]
+        if len(substitutions) != len(candidates):
+            # Skip invalid substitutions and warn about missing target glyph
+            self._warn_missing_targets(candidates, all_glyphs)
 
         return substitutions
+
+    @staticmethod
+    def _warn_missing_targets(
+        substitutions: Iterable[Tuple[str, str]], all_glyphs: AbstractSet[str]
+    ) -> None:
+        """Warn about each substitution skipped because its target glyph is missing"""
+        # Messages are only formatted when a logger is set up to receive them
+        if DSSketchLogger.get_logger() is None:
+            return
+        for from_glyph, to_glyph in substitutions:
+            if to_glyph not in all_glyphs:
+                DSSketchLogger.warning(
+                    f"Skipping substitution {from_glyph} -> {to_glyph} - target glyph '{to_glyph}' not found in UFO files"
+                )
@@ -4,11 +4,20 @@ Unified mappings for font attributes
 This module provides mappings between stylenames, OS/2 values, and user space coordinates.
 """
 
-import json
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Tuple
 
-import yaml
+from ..config import parse_json, parse_yaml
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mapping proxies and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 
 class UnifiedMappings:
@@ -18,6 +27,12 @@ class UnifiedMappings:
     MAPPINGS = {}
     DEFAULTS = {}
 
+    # Memoized lookups keyed by (name or value, axis_type); mappings never change once loaded
+    _user_space_cache: Dict[Tuple[str, str], float] = {}
+    _has_mapping_cache: Dict[Tuple[str, str], bool] = {}
+    _name_by_user_space_cache: Dict[Tuple[float, str], str] = {}
+    _name_by_os2_cache: Dict[Tuple[int, str], str] = {}
+
     @classmethod
     def _load_mappings(cls):
         """Load mappings from JSON or YAML file"""
@@ -36,7 +51,7 @@ class UnifiedMappings:
         if yaml_file.exists():
             try:
                 with open(yaml_file, encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
+                    data = parse_yaml(f.read())
             except Exception:
                 # YAML parsing failed, fall back to JSON
                 pass
@@ -44,8 +59,7 @@ class UnifiedMappings:
         # Try JSON if YAML didn't work
         if data is None and json_file.exists():
             try:
-                with open(json_file, encoding="utf-8") as f:
-                    data = json.load(f)
+                data = parse_json(json_file.read_bytes())
             except Exception:
                 pass
 
@@ -84,6 +98,10 @@ class UnifiedMappings:
                 "width": {"os2": 5, "user_space": 100.0},
             }
 
+        # Mappings are immutable once loaded - freeze them so they can be shared safely
+        cls.MAPPINGS = _freeze(cls.MAPPINGS)
+        cls.DEFAULTS = _freeze(cls.DEFAULTS)
+
     @classmethod
     def _resolve_alias(cls, name: str, axis_type: str) -> Dict[str, Any]:
         """Resolve alias to actual entry data"""
@@ -109,22 +127,29 @@ class UnifiedMappings:
     @classmethod
     def get_user_space_value(cls, name: str, axis_type: str) -> float:
         """Get user_space coordinate value by name"""
+        key = (name, axis_type)
+        value = cls._user_space_cache.get(key)
+        if value is not None:
+            return value
+
         cls._load_mappings()
         axis_type = axis_type.lower()
 
         entry = cls._resolve_alias(name, axis_type)
 
-        if entry:
+        if entry and "user_space" in entry:
             # Try user_space first, then fallback to os2
-            if "user_space" in entry:
-                return float(entry["user_space"])
-            elif "os2" in entry:
-                return float(entry["os2"])  # Fallback: use os2 as user_space
+            value = float(entry["user_space"])
+        elif entry and "os2" in entry:
+            value = float(entry["os2"])  # Fallback: use os2 as user_space
+        else:
+            # Default fallback from metadata
+            value = cls.DEFAULTS.get(axis_type, {}).get(
+                "user_space", 400.0 if axis_type == "weight" else 100.0
+            )
 
-        # Default fallback from metadata
-        return cls.DEFAULTS.get(axis_type, {}).get(
-            "user_space", 400.0 if axis_type == "weight" else 100.0
-        )
+        cls._user_space_cache[key] = value
+        return value
 
     @classmethod
     def get_os2_value(cls, name: str, axis_type: str) -> int:
@@ -147,6 +172,16 @@ class UnifiedMappings:
     @classmethod
     def get_name_by_user_space(cls, value: float, axis_type: str) -> str:
         """Get name by user_space coordinate value"""
+        key = (value, axis_type)
+        name = cls._name_by_user_space_cache.get(key)
+        if name is None:
+            name = cls._find_name_by_user_space(value, axis_type)
+            cls._name_by_user_space_cache[key] = name
+        return name
+
+    @classmethod
+    def _find_name_by_user_space(cls, value: float, axis_type: str) -> str:
+        """Scan mappings for the canonical name of a user_space value"""
         cls._load_mappings()
         axis_type = axis_type.lower()
         if axis_type in cls.MAPPINGS:
@@ -167,6 +202,16 @@ class UnifiedMappings:
     @classmethod
     def get_name_by_os2(cls, value: int, axis_type: str) -> str:
         """Get name by OS/2 table value"""
+        key = (value, axis_type)
+        name = cls._name_by_os2_cache.get(key)
+        if name is None:
+            name = cls._find_name_by_os2(value, axis_type)
+            cls._name_by_os2_cache[key] = name
+        return name
+
+    @classmethod
+    def _find_name_by_os2(cls, value: int, axis_type: str) -> str:
+        """Scan mappings for the canonical name of an OS/2 value"""
         cls._load_mappings()
         axis_type = axis_type.lower()
         if axis_type in cls.MAPPINGS:
@@ -192,14 +237,16 @@ class UnifiedMappings:
     @classmethod
     def has_mapping(cls, name: str, axis_type: str) -> bool:
         """Check if a name exists in standard mappings"""
+        key = (name, axis_type)
+        if key in cls._has_mapping_cache:
+            return cls._has_mapping_cache[key]
+
         cls._load_mappings()
         axis_type = axis_type.lower()
 
-        if axis_type not in cls.MAPPINGS:
-            return False
-
-        entry = cls._resolve_alias(name, axis_type)
-        return bool(entry)
+        result = axis_type in cls.MAPPINGS and bool(cls._resolve_alias(name, axis_type))
+        cls._has_mapping_cache[key] = result
+        return result
 
     @classmethod
     def get_all_labels(cls, axis_type: str) -> set:
@@ -4,11 +4,15 @@ Data models for DSSketch
 This module contains all dataclasses representing the DSSketch document structure.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class DSSAxisMapping:
     """Represents a single axis mapping point"""
     user_value: float        # User space value (400)
@@ -17,7 +21,7 @@ class DSSAxisMapping:
     elidable: bool = False  # Whether this label can be elided in font names
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DSSAxis:
     """Represents an axis in DSS format"""
     name: str
@@ -37,7 +41,7 @@ class DSSAxis:
         return user_value
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DSSSource:
     """Represents a source in DSS format"""
     name: str
@@ -52,7 +56,7 @@ class DSSSource:
     layer: Optional[str] = None  # UFO layer name (None = default layer)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DSSInstance:
     """Represents an instance in DSS format"""
     name: str
@@ -62,7 +66,7 @@ class DSSInstance:
     location: Dict[str, float] = field(default_factory=dict)  # axis_name -> design_value
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DSSRule:
     """Represents a substitution rule"""
     name: str
@@ -72,7 +76,7 @@ class DSSRule:
     to_pattern: Optional[str] = None  # target pattern like ".rvrn"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DSSAvar2Mapping:
     """Represents an avar2 mapping (inter-axis dependency)
 
@@ -89,7 +93,7 @@ class DSSAvar2Mapping:
     output: Dict[str, float]  # axis_name -> output value
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DSSDocument:
     """Complete DSS document structure"""
     family: str
@@ -4,11 +4,11 @@ UFO file validation for DSSketch
 This module handles validation of UFO files referenced in DSSketch documents.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Set
-
-from defcon import Font
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 from ..core.models import DSSDocument
 from ..utils.logging import DSSketchLogger
@@ -37,6 +37,10 @@ class ValidationReport:
 class UFOValidator:
     """Validate UFO files existence and basic structure"""
 
+    # Check UFOs in worker threads when a document references at least this many.
+    # Validation is stat-bound, so threads overlap the filesystem waits.
+    PARALLEL_MIN_UFOS = 8
+
     @staticmethod
     def validate_ufo_files(dss_doc: DSSDocument, dssketch_file_path: str) -> ValidationReport:
         """Validate UFO files existence and basic structure"""
@@ -64,16 +68,27 @@ class UFOValidator:
             report.path_errors.append(f"Sources path is not a directory: {base_path}")
             return report
 
-        # Check each source file
-        for source in dss_doc.sources:
-            ufo_path = base_path / source.filename
+        # Check each UFO once - layer sources often share the same file
+        ufo_paths = [base_path / source.filename for source in dss_doc.sources]
+        unique_paths = list(dict.fromkeys(ufo_paths))
+        if len(unique_paths) >= UFOValidator.PARALLEL_MIN_UFOS:
+            with ThreadPoolExecutor(max_workers=min(32, len(unique_paths))) as executor:
+                states = dict(
+                    zip(unique_paths, executor.map(UFOValidator._check_ufo, unique_paths))
+                )
+        else:
+            states = {ufo_path: UFOValidator._check_ufo(ufo_path) for ufo_path in unique_paths}
+
+        # Report per source, in document order
+        for source, ufo_path in zip(dss_doc.sources, ufo_paths):
+            is_valid = states[ufo_path]
 
-            if not ufo_path.exists():
+            if is_valid is None:
                 report.missing_files.append(str(ufo_path))
                 continue
 
             # Basic UFO validation
-            if not UFOValidator._is_valid_ufo(ufo_path):
+            if not is_valid:
                 report.invalid_ufos.append(str(ufo_path))
 
             # Check if filename ends with .ufo
@@ -83,49 +98,95 @@ class UFOValidator:
         return report
 
     @staticmethod
-    def _is_valid_ufo(ufo_path: Path) -> bool:
-        """Basic UFO structure validation"""
-        if not ufo_path.is_dir():
+    def _check_ufo(ufo_path: Path) -> Optional[bool]:
+        """Return None if UFO is missing, otherwise whether its structure is valid
+
+        Reads the UFO directory listing once instead of stat-ing each required entry.
+        """
+        try:
+            with os.scandir(ufo_path) as entries:
+                names = {entry.name for entry in entries}
+        except FileNotFoundError:
+            return None
+        except OSError:
+            # Not a directory (e.g. .ufoz archive) or unreadable
             return False
 
         # Check for required UFO files
-        required_files = ["metainfo.plist", "fontinfo.plist"]
-        for req_file in required_files:
-            if not (ufo_path / req_file).exists():
-                return False
+        if "metainfo.plist" not in names or "fontinfo.plist" not in names:
+            return False
 
         # Check for glyphs directory or layer contents
-        if not (ufo_path / "glyphs").exists() and not (ufo_path / "glyphs.contents.plist").exists():
-            return False
+        return "glyphs" in names or "glyphs.contents.plist" in names
 
-        return True
+    @staticmethod
+    def _is_valid_ufo(ufo_path: Path) -> bool:
+        """Basic UFO structure validation"""
+        return bool(UFOValidator._check_ufo(ufo_path))
 
 
 class UFOGlyphExtractor:
     """Extract glyph names from UFO files for wildcard pattern matching"""
 
+    # Glyph names per UFO path: path -> (fingerprint, names)
+    _glyph_names_cache: Dict[str, Tuple[Tuple[int, int], FrozenSet[str]]] = {}
+
+    @staticmethod
+    def _fingerprint(ufo_path: Path) -> Tuple[int, int]:
+        """Cheap change marker for a UFO's glyph set
+
+        Uses the default layer's contents.plist, which is rewritten whenever glyphs
+        are added, removed or renamed; falls back to the UFO itself (e.g. .ufoz).
+        """
+        try:
+            stat = (ufo_path / "glyphs" / "contents.plist").stat()
+        except OSError:
+            stat = ufo_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
     @staticmethod
     def get_glyph_names_from_ufo(ufo_path: Path) -> Set[str]:
-        """Extract all glyph names from a UFO file"""
+        """Extract all glyph names from a UFO file
+
+        Results are cached per process and reused while the UFO's fingerprint
+        is unchanged, so rules and writers sharing sources open each UFO once.
+        """
+        key = str(ufo_path)
+        try:
+            fingerprint = UFOGlyphExtractor._fingerprint(ufo_path)
+        except OSError:
+            fingerprint = None
+
+        cached = UFOGlyphExtractor._glyph_names_cache.get(key)
+        if cached is not None and fingerprint is not None and cached[0] == fingerprint:
+            return set(cached[1])
+
+        # defcon is only needed when glyph names are actually read
+        from defcon import Font
+
         try:
             font = Font(str(ufo_path))
-            return set(font.keys())
+            glyph_names = frozenset(font.keys())
         except Exception as e:
             DSSketchLogger.warning(f"Could not read glyphs from {ufo_path}: {e}")
             return set()
 
+        if fingerprint is not None:
+            UFOGlyphExtractor._glyph_names_cache[key] = (fingerprint, glyph_names)
+        return set(glyph_names)
+
     @staticmethod
     def get_all_glyphs_from_sources(sources, base_path: Path = None) -> Set[str]:
         """Extract all unique glyph names from all sources
 
         Args:
-            sources: List of source descriptors or DSSMaster objects
+            sources: List of source descriptors or DSSSource objects
             base_path: Base path for resolving relative UFO paths
         """
         all_glyphs = set()
 
         for source in sources:
-            # Handle both DesignSpace sources and DSSMaster objects
+            # Handle both DesignSpace sources and DSSSource objects
             filename = getattr(source, "filename", None)
             if not filename:
                 continue
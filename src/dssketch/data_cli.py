@@ -2,14 +2,19 @@
 """CLI utility for managing DSSketch data files"""
 
 import argparse
-import platform
-import subprocess
 import sys
+from functools import lru_cache
 
 from .config import get_data_manager
 from .utils.logging import DSSketchLogger
 
 
+@lru_cache(maxsize=None)
+def _get_opener() -> tuple:
+    """Return the command used to open a directory in the system file manager"""
+    return {"win32": ("explorer",), "darwin": ("open",)}.get(sys.platform, ("xdg-open",))
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="dssketch-data", description="Manage DSSketch configuration data files"
@@ -87,12 +92,9 @@ def main():
 
         # Open in file manager
         try:
-            if platform.system() == "Windows":
-                subprocess.run(["explorer", str(path)])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", str(path)])
-            else:  # Linux
-                subprocess.run(["xdg-open", str(path)])
+            import subprocess
+
+            subprocess.run([*_get_opener(), str(path)])
             print(f"📂 Opened: {path}")
         except Exception as e:
             print(f"❌ Could not open directory: {e}")
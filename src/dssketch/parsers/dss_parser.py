@@ -6,7 +6,7 @@ Clean version with separated validation concerns.
 
 import re
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 
 from ..core.mappings import Standards
 from ..core.models import DSSAxis, DSSAxisMapping, DSSDocument, DSSInstance, DSSSource, DSSRule, DSSAvar2Mapping
@@ -14,6 +14,26 @@ from ..utils.discrete import DiscreteAxisHandler
 from ..utils.dss_validator import DSSValidationError, DSSValidator
 from ..utils.logging import DSSketchLogger
 
+# Numeric token: optional sign, digits with optional fraction, optional exponent
+_NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Axis line patterns
+_AXIS_DISPLAY_NAME_RE = re.compile(r'"([^"]+)"$')  # opsz 8:14:144 "Optical size"
+_AXIS_FULL_FORM_RE = re.compile(r"\b(\w{4})\s+(\S+)$")  # [name] tag range
+_AXIS_LEGACY_RE = re.compile(r"^\w+\s+[\d.:+-]+$")  # name range (numeric)
+_AXIS_NAMED_RE = re.compile(r"^\w+\s+(\S+)")  # human-readable name range
+
+# Source line patterns
+_LAYER_QUOTED_RE = re.compile(r'@layer\s*[=]?\s*["\']([^"\']+)["\']')
+_LAYER_PLAIN_RE = re.compile(r"@layer\s*=\s*(\S+)")
+_NAMED_COORD_START_RE = re.compile(r"\s+(\w+)=([\w.-]+)")
+_NAMED_COORD_RE = re.compile(r"(\w+)=([\w.-]+)")
+
+# Rule patterns
+_RANGE_CONDITION_RE = re.compile(r"([-\d.]+|\w+)\s*<=\s*(\w+)\s*<=\s*([-\d.]+|\w+)")
+_STD_CONDITION_RE = re.compile(r"(\w+)\s*(>=|<=|==)\s*([-\d.]+|\w+)")
+_RULE_RE = re.compile(r'^(.+?)\s*>\s*(.+?)\s*\(([^)]+)\)(?:\s*"([^"]+)")?')
+
 
 class DSSParser:
     """Parse DSS format into structured data with clean validation separation"""
@@ -37,6 +57,11 @@ class DSSParser:
         self.validator = DSSValidator(strict_mode=strict_mode)
         # Note: Rule names now handled via @name syntax instead of comments
 
+    @staticmethod
+    def _is_number(token: str) -> bool:
+        """Check if token is a numeric literal (e.g. "400", "-15.5", "1e3")"""
+        return _NUMBER_RE.fullmatch(token) is not None
+
     @staticmethod
     def _extract_quoted_or_plain_value(text: str) -> str:
         """Extract value that may be quoted ("value" or 'value') or plain (value)
@@ -67,15 +92,20 @@ class DSSParser:
         return parts[0] if parts else ""
 
     def parse_file(self, filepath: str) -> DSSDocument:
-        """Parse DSS file"""
+        """Parse DSS file
+
+        Lines are streamed from the file, so neither the whole content nor a list
+        of all lines is held in memory.
+        """
         with open(filepath, encoding="utf-8") as f:
-            content = f.read()
-        return self.parse(content)
+            return self._parse_lines(line[:-1] if line.endswith("\n") else line for line in f)
 
     def parse(self, content: str) -> DSSDocument:
         """Parse DSS content"""
-        lines = content.split("\n")
+        return self._parse_lines(content.split("\n"))
 
+    def _parse_lines(self, lines: Iterable[str]) -> DSSDocument:
+        """Parse DSS content given as lines without line terminators"""
         for line_no, line in enumerate(lines, 1):
             original_line = line.rstrip()  # Keep leading spaces but remove trailing
 
@@ -298,7 +328,7 @@ class DSSParser:
         display_name = None
         if '"' in line:
             # Check for quoted string at end
-            match = re.search(r'"([^"]+)"$', line)
+            match = _AXIS_DISPLAY_NAME_RE.search(line)
             if match:
                 display_name = match.group(1)
                 line = line[:match.start()].strip()
@@ -316,7 +346,7 @@ class DSSParser:
         # Strategy: find the range (contains ':' or is binary/discrete), then tag before it
         # Range can be numeric (100:400:900) or label-based (Thin:Regular:Black)
         # Use \b word boundary to ensure tag is a standalone 4-char word (not end of "weight")
-        full_form_match = re.search(r"\b(\w{4})\s+(\S+)$", line)
+        full_form_match = _AXIS_FULL_FORM_RE.search(line)
 
         # Validate that range_part looks like a range (contains ':' or is binary/discrete)
         if full_form_match and ">" not in line:
@@ -355,8 +385,7 @@ class DSSParser:
             # Validate axis range (skip validation for label-based ranges)
             # Check if this might be a label-based range
             is_label_based = ":" in range_part and not all(
-                v.replace(".", "").replace("-", "").replace("+", "").isdigit()
-                for v in range_part.split(":")
+                self._is_number(v) for v in range_part.split(":")
             )
 
             if not is_label_based:
@@ -393,7 +422,7 @@ class DSSParser:
                     self.validator.errors.append(f"Invalid axis range for '{name}': {e}")
                     return
 
-        elif re.match(r"^\w+\s+[\d.:+-]+$", line) and ">" not in line:
+        elif _AXIS_LEGACY_RE.match(line) and ">" not in line:
             # Legacy form: name range (infer tag from name)
             # e.g., "weight 100:400:900"
             parts = line.split()
@@ -405,8 +434,7 @@ class DSSParser:
 
             # Check if this might be a label-based range
             is_label_based = ":" in range_part and not all(
-                v.replace(".", "").replace("-", "").replace("+", "").isdigit()
-                for v in range_part.split(":")
+                self._is_number(v) for v in range_part.split(":")
             )
 
             if not is_label_based:
@@ -441,7 +469,7 @@ class DSSParser:
                     self.validator.errors.append(f"Invalid axis range for '{name}': {e}")
                     return
 
-        elif re.match(r"^\w+\s+(\S+)", line) and ">" not in line and "@elidable" not in line:
+        elif _AXIS_NAMED_RE.match(line) and ">" not in line and "@elidable" not in line:
             # Human-readable axis names: "weight 100:400:900" or "width Condensed:Normal:Extended"
             # Supports both numeric and label-based ranges
             # Excludes discrete axis labels like "Upright @elidable"
@@ -485,8 +513,7 @@ class DSSParser:
 
                 # Validate axis range (skip validation for label-based ranges)
                 is_label_based = ":" in range_part and not all(
-                    v.replace(".", "").replace("-", "").replace("+", "").isdigit()
-                    for v in range_part.split(":")
+                    self._is_number(v) for v in range_part.split(":")
                 )
 
                 if not is_label_based:
@@ -557,7 +584,7 @@ class DSSParser:
             # Parse left side
             left_parts = left.split()
 
-            if left_parts[0].replace(".", "").replace("-", "").isdigit():
+            if self._is_number(left_parts[0]):
                 # Format: "300 Light" or "0.0 Upright" or just "8" (pure numeric)
                 user = float(left_parts[0])
                 label = " ".join(left_parts[1:]) if len(left_parts) > 1 else ""
@@ -807,14 +834,14 @@ class DSSParser:
         # Extract @layer flag: @layer="name", @layer 'name', or @layer=name (without quotes)
         layer = None
         # First try with quotes: @layer="name" or @layer 'name'
-        layer_match = re.search(r'@layer\s*[=]?\s*["\']([^"\']+)["\']', line)
+        layer_match = _LAYER_QUOTED_RE.search(line)
         if layer_match:
             layer = layer_match.group(1)
             line = line[:layer_match.start()] + line[layer_match.end():]
             line = line.strip()
         else:
             # Try without quotes: @layer=name (value until whitespace or end)
-            layer_match = re.search(r'@layer\s*=\s*(\S+)', line)
+            layer_match = _LAYER_PLAIN_RE.search(line)
             if layer_match:
                 layer = layer_match.group(1)
                 line = line[:layer_match.start()] + line[layer_match.end():]
@@ -852,14 +879,9 @@ class DSSParser:
 
     def _parse_source_named(self, line: str, is_base: bool, layer: str = None, is_sparse: bool = False):
         """Parse source with named coordinates: Source axis=val, axis=val"""
-        import re
-
         # Find where named coordinates start (first word=value pattern)
         # Pattern: word=value where value can be number, label, or negative number
-        named_pattern = r'\s+(\w+)=([\w.-]+)'
-
-        # Find first match to split name from coordinates
-        match = re.search(named_pattern, line)
+        match = _NAMED_COORD_START_RE.search(line)
         if not match:
             self.validator.errors.append(f"Invalid named coordinate format: {line}")
             return
@@ -877,7 +899,7 @@ class DSSParser:
             location[axis.name] = axis.default
 
         # Parse named coordinates and override defaults
-        coord_pairs = re.findall(r'(\w+)=([\w.-]+)', coords_part)
+        coord_pairs = _NAMED_COORD_RE.findall(coords_part)
         for axis_ref, value_str in coord_pairs:
             # Find axis by name or tag
             axis = self._find_axis_by_name_or_tag(axis_ref)
@@ -943,49 +965,41 @@ class DSSParser:
         coord_parts = [x.strip() for x in coords_str.split(",")]
 
         # Check if all parts are numeric
-        all_numeric = all(
-            x.replace(".", "")
-            .replace("-", "")
-            .replace("+", "")
-            .replace("e", "")
-            .replace("E", "")
-            .isdigit()
-            for x in coord_parts
-            if x
-        )
+        all_numeric = all(self._is_number(x) for x in coord_parts if x)
 
         if all_numeric:
-            # Traditional numeric validation
-            is_valid, error_msg = DSSValidator.validate_coordinates(coords_str)
-            if not is_valid:
-                self.validator.errors.append(
-                    f"Invalid coordinates in source '{name}': {error_msg}"
-                )
-                return
+            # Fast path: plain numbers need no per-coordinate label resolution.
+            # Only empty values can fail here - report them via the validator.
+            if not all(coord_parts):
+                is_valid, error_msg = DSSValidator.validate_coordinates(coords_str)
+                if not is_valid:
+                    self.validator.errors.append(
+                        f"Invalid coordinates in source '{name}': {error_msg}"
+                    )
+                    return
 
-        # Resolve coordinates - supports both numbers and labels
-        coords = []
-        for i, coord_str in enumerate(coord_parts):
-            try:
-                value = self._resolve_coordinate_value(coord_str, i)
-                coords.append(value)
-            except ValueError as e:
-                self.validator.errors.append(
-                    f"Invalid coordinate in source '{name}' at position {i}: {e}"
-                )
-                return
+            coords = [float(x) for x in coord_parts]
+        else:
+            # Resolve coordinates - supports both numbers and labels
+            coords = []
+            for i, coord_str in enumerate(coord_parts):
+                try:
+                    value = self._resolve_coordinate_value(coord_str, i)
+                    coords.append(value)
+                except ValueError as e:
+                    self.validator.errors.append(
+                        f"Invalid coordinate in source '{name}' at position {i}: {e}"
+                    )
+                    return
 
         # Create location dict using explicit axis order if available
         location = {}
         if self.source_axis_order:
-            # Use explicit axis order from sources section
-            for i, axis_name in enumerate(self.source_axis_order):
-                if i < len(coords):
-                    # Find the matching axis in document.axes to get the full axis object
-                    for axis in self.document.axes:
-                        if axis.name == axis_name:
-                            location[axis.name] = coords[i]
-                            break
+            # Use explicit axis order from sources section, skipping unknown axes
+            axis_names = {axis.name for axis in self.document.axes}
+            for axis_name, value in zip(self.source_axis_order, coords):
+                if axis_name in axis_names:
+                    location[axis_name] = value
         else:
             # Fallback to document.axes order (backward compatibility)
             for i, axis in enumerate(self.document.axes):
@@ -1049,7 +1063,7 @@ class DSSParser:
         for cond_part in cond_parts:
             # Try range condition first: "400 <= weight <= 700", "Regular <= weight <= Bold", "-100 <= weight <= 200"
             # Pattern accepts both numbers (with optional negative sign) and words (labels)
-            range_match = re.search(r"([-\d.]+|\w+)\s*<=\s*(\w+)\s*<=\s*([-\d.]+|\w+)", cond_part)
+            range_match = _RANGE_CONDITION_RE.search(cond_part)
             if range_match:
                 min_str = range_match.group(1)
                 axis = range_match.group(2)
@@ -1068,7 +1082,7 @@ class DSSParser:
 
             # Standard conditions: "weight >= 480", "weight >= Bold", "weight <= 400", "weight == Regular"
             # Pattern accepts both numbers (with optional negative sign) and words (labels)
-            std_match = re.search(r"(\w+)\s*(>=|<=|==)\s*([-\d.]+|\w+)", cond_part)
+            std_match = _STD_CONDITION_RE.search(cond_part)
             if std_match:
                 axis = std_match.group(1)
                 operator = std_match.group(2)
@@ -1175,7 +1189,7 @@ class DSSParser:
                 return
 
             # Parse parentheses syntax: pattern > target (condition) "name"
-            paren_match = re.match(r'^(.+?)\s*>\s*(.+?)\s*\(([^)]+)\)(?:\s*"([^"]+)")?', line)
+            paren_match = _RULE_RE.match(line)
 
             if paren_match:
                 from_part = paren_match.group(1).strip()
@@ -38,10 +38,10 @@ class DiscreteAxisHandler:
         Returns:
             Dictionary mapping axis tags to value->labels mappings
         """
-        from ..config import get_data_manager
+        from ..config import load_discrete_labels
 
-        # Load from data manager (with user overrides)
-        labels = get_data_manager().load_data_file("discrete-axis-labels.yaml")
+        # Load from data manager (with user overrides, cached per process)
+        labels = load_discrete_labels()
 
         if labels:
             # Convert string keys to int for values
@@ -49,7 +49,7 @@ class DiscreteAxisHandler:
             for axis, values in labels.items():
                 result[axis] = {}
                 for value, names in values.items():
-                    result[axis][int(value)] = names if isinstance(names, list) else [names]
+                    result[axis][int(value)] = list(names) if isinstance(names, list) else [names]
             return result
 
         # Default fallback if file not found
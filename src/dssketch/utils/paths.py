@@ -0,0 +1,13 @@
+"""
+Path string helpers
+
+DesignSpace and DSSketch store relative paths with forward slashes.
+"""
+
+
+def to_posix_path(path: str) -> str:
+    """Return path with backslashes replaced by forward slashes
+
+    Paths that already use forward slashes (the usual case) are returned as is.
+    """
+    return path.replace("\\", "/") if "\\" in path else path
@@ -4,7 +4,9 @@ Pattern matching utilities for wildcard glyph patterns
 This module provides utilities for matching and expanding wildcard patterns in glyph names.
 """
 
-from typing import List, Optional, Set
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Pattern, Set, Tuple
 
 
 class PatternMatcher:
@@ -37,14 +39,36 @@ class PatternMatcher:
             return glyph_name.startswith(prefix) and glyph_name.endswith(suffix)
 
     @staticmethod
-    def find_matching_glyphs(patterns: List[str], all_glyphs: Set[str]) -> Set[str]:
-        """Find all glyphs that match any of the given patterns"""
-        matched = set()
-        for pattern in patterns:
-            for glyph in all_glyphs:
-                if PatternMatcher.matches_pattern(glyph, pattern):
-                    matched.add(glyph)
-        return matched
+    def _pattern_regex(pattern: str) -> str:
+        """Regex source equivalent to matches_pattern() for one pattern (used with re.match)"""
+        if "*" not in pattern:
+            return re.escape(pattern) + r"\Z"
+
+        if pattern.endswith("*"):
+            return re.escape(pattern[:-1])
+        elif pattern.startswith("*"):
+            return r"(?s:.*)" + re.escape(pattern[1:]) + r"\Z"
+        else:
+            # Prefix and suffix may overlap, as with startswith() and endswith()
+            prefix, suffix = pattern.split("*", 1)
+            return r"(?=" + re.escape(prefix) + r")(?s:.*)" + re.escape(suffix) + r"\Z"
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _compile_patterns(patterns: Tuple[str, ...]) -> Pattern[str]:
+        """Compile a set of patterns into a single alternation regex"""
+        return re.compile("|".join(f"(?:{PatternMatcher._pattern_regex(p)})" for p in patterns))
+
+    @staticmethod
+    def find_matching_glyphs(patterns: List[str], all_glyphs: Iterable[str]) -> Set[str]:
+        """Find all glyphs that match any of the given patterns
+
+        All patterns are combined into one regex, so each glyph name is tested once.
+        """
+        if not patterns:
+            return set()
+        match = PatternMatcher._compile_patterns(tuple(patterns)).match
+        return {glyph for glyph in all_glyphs if match(glyph)}
 
     @staticmethod
     def detect_pattern_from_glyphs(glyph_names: List[str]) -> Optional[str]:
@@ -4,7 +4,8 @@ DSS Writer for DSSketch
 This module handles writing DSSketch documents to DSS string format with optimization features.
 """
 
-from typing import List, Optional, Set, Tuple
+from pathlib import Path
+from typing import Iterator, List, Optional, Set, Tuple
 
 # For DesignSpace document type hints
 from fontTools.designspaceLib import DesignSpaceDocument
@@ -45,6 +46,8 @@ class DSSWriter:
         self.use_label_coordinates = use_label_coordinates
         self.use_label_ranges = use_label_ranges
         self.avar2_format = avar2_format  # "matrix" or "linear"
+        # Per-write cache: id(axis) -> {design_value: label}
+        self._coordinate_labels = {}
 
     @staticmethod
     def _quote_if_spaces(value: str) -> str:
@@ -75,30 +78,77 @@ class DSSWriter:
 
     def write(self, dss_doc: DSSDocument) -> str:
         """Generate DSS string from document"""
-        lines = []
+        return "\n".join(self._iter_lines(dss_doc)).strip()
+
+    def write_bytes(self, dss_doc: DSSDocument) -> bytes:
+        """Generate DSS output for document as UTF-8 bytes (same content as write())"""
+        buffer = bytearray()
+        for chunk in self._iter_trimmed(dss_doc):
+            buffer += chunk.encode("utf-8")
+        return bytes(buffer)
+
+    def write_file(self, dss_doc: DSSDocument, filepath) -> None:
+        """Stream DSS output for document to file as UTF-8 with LF line endings
+
+        Produces the same content as write() without building the whole string:
+        lines are encoded directly into a 1 MiB binary write buffer (no text-mode
+        wrapper).
+        """
+        with open(filepath, "wb", buffering=1 << 20) as f:
+            for chunk in self._iter_trimmed(dss_doc):
+                f.write(chunk.encode("utf-8"))
+
+    def _iter_trimmed(self, dss_doc: DSSDocument) -> Iterator[str]:
+        """Yield output lines with newlines, trimmed exactly like write()
+
+        The last non-blank line is held back until a later one arrives, so that
+        leading and trailing whitespace of the whole output can be stripped
+        without building it first.
+        """
+        held = None  # Last non-blank line, written once a later one arrives
+        pending = []  # Blank lines seen after the held line
+        for line in self._iter_lines(dss_doc):
+            if not line.strip():
+                if held is not None:
+                    pending.append(line)
+                continue
+            if held is None:
+                held = line.lstrip()
+                continue
+            yield f"{held}\n"
+            for blank in pending:
+                yield f"{blank}\n"
+            pending.clear()
+            held = line
+        if held is not None:
+            yield held.rstrip()
+
+    def _iter_lines(self, dss_doc: DSSDocument) -> Iterator[str]:
+        """Yield DSS output lines for document, section by section"""
+        self._coordinate_labels = {}
 
         # Family declaration (with quotes if it contains spaces)
         family_value = self._quote_if_spaces(dss_doc.family)
-        lines.append(f"family {family_value}")
+        yield f"family {family_value}"
         if dss_doc.suffix:
-            lines.append(f"suffix {dss_doc.suffix}")
+            yield f"suffix {dss_doc.suffix}"
         if dss_doc.path:
-            lines.append(f"path {dss_doc.path}")
-        lines.append("")
+            yield f"path {dss_doc.path}"
+        yield ""
 
         # Axes section
         if dss_doc.axes:
-            lines.append("axes")
+            yield "axes"
             for axis in dss_doc.axes:
-                lines.extend(self._format_axis(axis))
-            lines.append("")
+                yield from self._format_axis(axis)
+            yield ""
 
         # Hidden axes section (avar2)
         if dss_doc.hidden_axes:
-            lines.append("axes hidden")
+            yield "axes hidden"
             for axis in dss_doc.hidden_axes:
-                lines.extend(self._format_hidden_axis(axis))
-            lines.append("")
+                yield from self._format_hidden_axis(axis)
+            yield ""
 
         # Sources section
         if dss_doc.sources:
@@ -107,65 +157,63 @@ class DSSWriter:
 
             if use_named_format:
                 # Named format: no axis header needed
-                lines.append("sources")
+                yield "sources"
                 for source in dss_doc.sources:
-                    lines.append(self._format_source_named(source, dss_doc))
+                    yield self._format_source_named(source, dss_doc)
             else:
                 # Positional format: include axis header
                 if dss_doc.axes:
                     # Use axis.tag directly, not axis.name (which may be display name)
                     axis_tags = [axis.tag for axis in dss_doc.axes]
-                    lines.append(f"sources [{', '.join(axis_tags)}]")
+                    yield f"sources [{', '.join(axis_tags)}]"
                 else:
-                    lines.append("sources")
+                    yield "sources"
                 for source in dss_doc.sources:
-                    lines.append(self._format_source(source, dss_doc.axes))
-            lines.append("")
+                    yield self._format_source(source, dss_doc.axes)
+            yield ""
 
         # avar2 vars section
         if dss_doc.avar2_vars:
-            lines.append("avar2 vars")
+            yield "avar2 vars"
             for var_name, var_value in dss_doc.avar2_vars.items():
                 count = dss_doc.avar2_vars_counts.get(var_name, 0)
                 if count > 0:
-                    lines.append(f"    ${var_name} = {self._format_number(var_value)}  # used {count} times")
+                    yield f"    ${var_name} = {self._format_number(var_value)}  # used {count} times"
                 else:
-                    lines.append(f"    ${var_name} = {self._format_number(var_value)}")
-            lines.append("")
+                    yield f"    ${var_name} = {self._format_number(var_value)}"
+            yield ""
 
         # avar2 mappings section
         if dss_doc.avar2_mappings:
             if self.avar2_format == "matrix":
-                lines.extend(self._format_avar2_as_matrix(dss_doc))
+                yield from self._format_avar2_as_matrix(dss_doc)
             else:
-                lines.append("avar2")
+                yield "avar2"
                 for mapping in dss_doc.avar2_mappings:
-                    lines.extend(self._format_avar2_mapping(mapping, dss_doc))
-            lines.append("")
+                    yield from self._format_avar2_mapping(mapping, dss_doc)
+            yield ""
 
         # Rules section
         if dss_doc.rules:
-            lines.append("rules")
+            yield "rules"
             for rule in dss_doc.rules:
-                lines.extend(self._format_rule(rule, dss_doc.axes))
-            lines.append("")
+                yield from self._format_rule(rule, dss_doc.axes)
+            yield ""
 
         # Instances section
         if dss_doc.instances_off:
-            lines.append("instances off")
+            yield "instances off"
         elif dss_doc.instances_auto:
-            lines.append("instances auto")
+            yield "instances auto"
         elif dss_doc.instances:
             if self.optimize:
                 # When optimizing with explicit instances, use instances auto
                 # (assumes instances can be regenerated from axis labels)
-                lines.append("instances auto")
+                yield "instances auto"
             else:
-                lines.append("instances")
+                yield "instances"
                 for instance in dss_doc.instances:
-                    lines.append(self._format_instance(instance, dss_doc.axes))
-
-        return "\n".join(lines).strip()
+                    yield self._format_instance(instance, dss_doc.axes)
 
     def _get_label_for_user_value(self, axis: DSSAxis, user_value: float) -> Optional[str]:
         """Try to find a label for a user space value
@@ -361,10 +409,14 @@ class DSSWriter:
         Returns:
             Label name if found, None otherwise
         """
-        for mapping in axis.mappings:
-            if mapping.design_value == value:
-                return mapping.label
-        return None
+        labels = self._coordinate_labels.get(id(axis))
+        if labels is None:
+            # Index mappings once per axis, keeping the first label for each value
+            labels = {}
+            for mapping in axis.mappings:
+                labels.setdefault(mapping.design_value, mapping.label)
+            self._coordinate_labels[id(axis)] = labels
+        return labels.get(value)
 
     def _format_condition_value(self, value: float, axis_name: str, axes: List[DSSAxis]) -> str:
         """Format a condition value - try to use label if available, otherwise format number
@@ -560,7 +612,7 @@ class DSSWriter:
             if self.ds_doc and self.base_path:
                 try:
                     available_glyphs = UFOGlyphExtractor.get_all_glyphs_from_sources(
-                        self.ds_doc, self.base_path
+                        self.ds_doc.sources, Path(self.base_path)
                     )
                 except Exception:
                     # If glyph extraction fails, continue without validation
@@ -0,0 +1,44 @@
+"""Tests for the bounded conversion cache in the public API module"""
+
+import os
+from collections import OrderedDict
+
+from src.dssketch import api
+
+
+class TestConversionCacheBounds:
+    """Memory and disk caches evict old entries instead of growing forever"""
+
+    def test_memory_cache_evicts_least_recently_used(self, monkeypatch):
+        """Only the newest entries are kept; a hit refreshes an entry"""
+        monkeypatch.setattr(api, "_memory_cache", OrderedDict())
+        monkeypatch.setattr(api, "_MEMORY_CACHE_SIZE", 2)
+
+        api._remember("a", b"1")
+        api._remember("b", b"2")
+        api._remember("a", b"1")
+        api._remember("c", b"3")
+
+        assert list(api._memory_cache) == ["a", "c"]
+
+    def test_disk_cache_prunes_other_versions_and_old_entries(self, tmp_path, monkeypatch):
+        """Entries of other versions are deleted and only the newest current ones remain"""
+        monkeypatch.setattr(api, "_DISK_CACHE_SIZE", 2)
+
+        for age, name in enumerate(["new-1.0.pkl", "mid-1.0.pkl", "old-1.0.pkl"]):
+            path = tmp_path / name
+            path.write_bytes(b"")
+            os.utime(path, ns=(0, 10**9 * (10 - age)))
+        (tmp_path / "any-0.9.pkl").write_bytes(b"")
+        (tmp_path / "any-0.9.tmp").write_bytes(b"")
+        (tmp_path / "busy-1.0.tmp").write_bytes(b"")
+        (tmp_path / "notes.txt").write_bytes(b"")
+
+        api._prune_disk_cache(tmp_path, "1.0")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "busy-1.0.tmp",
+            "mid-1.0.pkl",
+            "new-1.0.pkl",
+            "notes.txt",
+        ]
@@ -0,0 +1,52 @@
+"""Tests for DSSketch data models"""
+
+import pickle
+import sys
+from dataclasses import fields
+
+import pytest
+from src.dssketch.core.models import (
+    DSSAvar2Mapping,
+    DSSAxis,
+    DSSAxisMapping,
+    DSSDocument,
+    DSSInstance,
+    DSSRule,
+    DSSSource,
+)
+
+MODELS = [DSSAxisMapping, DSSAxis, DSSSource, DSSInstance, DSSRule, DSSAvar2Mapping, DSSDocument]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+class TestModelSlots:
+    """Models are slotted so documents with many sources/instances stay compact"""
+
+    @pytest.mark.parametrize("model", MODELS, ids=lambda m: m.__name__)
+    def test_model_has_slots_for_all_fields(self, model):
+        """Every field is a slot and instances carry no __dict__"""
+        assert set(model.__slots__) == {f.name for f in fields(model)}
+        assert "__dict__" not in dir(model)
+
+    def test_unknown_attribute_rejected(self):
+        """Assigning a non-field attribute fails instead of growing a __dict__"""
+        source = DSSSource(name="Regular", filename="Regular.ufo", location={})
+        with pytest.raises(AttributeError):
+            source.unknown = True
+
+    def test_document_pickle_roundtrip(self):
+        """Slotted models survive pickling (used by the conversion cache)"""
+        doc = DSSDocument(family="TestFont")
+        doc.axes = [
+            DSSAxis(
+                name="weight", tag="wght", minimum=100, default=400, maximum=900,
+                mappings=[DSSAxisMapping(user_value=400, design_value=90, label="Regular")],
+            )
+        ]
+        doc.sources = [DSSSource(name="Regular", filename="Regular.ufo",
+                                 location={"weight": 90}, is_base=True)]
+
+        restored = pickle.loads(pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL))
+
+        assert restored == doc
+        assert restored.axes[0].mappings[0].label == "Regular"
@@ -0,0 +1,69 @@
+"""Tests for glyph validation of wildcard rule patterns in DSSWriter
+
+When the writer gets the DesignSpace document, it checks compact wildcard
+patterns against the glyphs of the source UFOs and falls back to explicit
+glyph lists if a wildcard would match more glyphs than the rule substitutes.
+"""
+
+import pytest
+from fontTools.designspaceLib import DesignSpaceDocument, SourceDescriptor
+
+from src.dssketch.core.models import DSSAxis, DSSDocument, DSSRule, DSSSource
+from src.dssketch.core.validation import UFOGlyphExtractor
+from src.dssketch.writers.dss_writer import DSSWriter
+
+UFO_GLYPHS = {"dollar", "dollar.sc", "dollar.alt", "dollar.rvrn", "dollar.sc.rvrn"}
+
+
+@pytest.fixture
+def ufo_dir(tmp_path, monkeypatch):
+    """Directory with one (empty) UFO whose glyph names come from UFO_GLYPHS"""
+    (tmp_path / "Font-Regular.ufo").mkdir()
+    monkeypatch.setattr(
+        UFOGlyphExtractor,
+        "get_glyph_names_from_ufo",
+        staticmethod(lambda ufo_path: set(UFO_GLYPHS)),
+    )
+    return tmp_path
+
+
+def _dss_doc():
+    doc = DSSDocument(family="TestFont")
+    doc.axes = [DSSAxis(name="weight", tag="wght", minimum=100, default=400, maximum=900)]
+    doc.sources = [
+        DSSSource(name="Regular", filename="Font-Regular.ufo",
+                  location={"weight": 400}, is_base=True),
+    ]
+    doc.rules = [
+        DSSRule(
+            name="switch",
+            substitutions=[("dollar", "dollar.rvrn"), ("dollar.sc", "dollar.sc.rvrn")],
+            conditions=[{"axis": "weight", "minimum": 600, "maximum": 900}],
+        )
+    ]
+    return doc
+
+
+def _ds_doc():
+    ds = DesignSpaceDocument()
+    source = SourceDescriptor()
+    source.filename = "Font-Regular.ufo"
+    source.location = {"weight": 400}
+    ds.addSource(source)
+    return ds
+
+
+class TestRuleGlyphValidation:
+    """Wildcard detection in rules honours the glyphs available in the UFOs"""
+
+    def test_wildcard_without_designspace(self):
+        """Without the DesignSpace document, the detected wildcard is used as-is"""
+        output = DSSWriter().write(_dss_doc())
+        assert "dol* > .rvrn" in output
+
+    def test_overmatching_wildcard_listed_explicitly(self, ufo_dir):
+        """dol* would also match dollar.alt, so the glyphs are listed explicitly"""
+        writer = DSSWriter(ds_doc=_ds_doc(), base_path=str(ufo_dir))
+        output = writer.write(_dss_doc())
+        assert "dollar dollar.sc > .rvrn" in output
+        assert "dol*" not in output
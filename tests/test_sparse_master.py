@@ -133,6 +133,24 @@ class TestSparseWriting:
 
         assert "@sparse" not in output
 
+    def test_write_file_matches_write(self, tmp_path):
+        """write_file() and write_bytes() produce exactly the same content as write()"""
+        doc = DSSDocument(family="TestFont")
+        doc.axes = [DSSAxis(name="weight", tag="wght", minimum=100, default=400, maximum=900)]
+        doc.sources = [
+            DSSSource(name="Regular", filename="Font-Regular.ufo",
+                      location={"weight": 400}, is_base=True),
+            DSSSource(name="Correction", filename="Font-Correction-sparse.ufo",
+                      location={"weight": 500}, is_sparse=True),
+        ]
+
+        writer = DSSWriter(use_label_coordinates=False)
+        output_path = tmp_path / "TestFont.dssketch"
+        writer.write_file(doc, output_path)
+
+        assert output_path.read_text(encoding="utf-8") == writer.write(doc)
+        assert writer.write_bytes(doc) == writer.write(doc).encode("utf-8")
+
 
 class TestSparseRoundtripDSS:
     """Test DSSketch → DSSketch roundtrip preserves @sparse"""